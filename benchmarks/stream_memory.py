@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Пиковая память при обычном и потоковом (--stream) разборе ответа API.
+
+Генерирует расписания разного размера, отдаёт их локальным HTTP-сервером и
+для каждого размера запускает отдельный процесс, который запрашивает один
+день. Печатает прирост пикового RSS процесса относительно состояния до запроса.
+
+    python benchmarks/stream_memory.py [--sizes 5000,50000,200000]
+"""
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+from argparse import ArgumentParser
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SEMESTER_START = date(2025, 9, 1)
+REQUESTED_DATE = "2025-09-03"
+
+
+def write_payload(path: Path, lessons: int):
+    # Пишется по занятию за раз, чтобы не раздувать память родительского процесса
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write('{"group": "ИСПа", "classes": [')
+        for index in range(lessons):
+            first = SEMESTER_START + timedelta(days=index % 120)
+            info = {
+                "dates": [(first + timedelta(weeks=week)).isoformat() for week in range(8)],
+                "class": index % 6 + 1,
+                "auditorium": "%dГЛ" % (100 + index % 400),
+                "type": "лек",
+                "discipline": "Дисциплина номер %d" % index,
+                "lecturer": "Преподаватель %d П П" % (index % 300),
+                "groups": ["ИСПа", "ИСПб"],
+            }
+            fp.write(("," if index else "") + json.dumps(info, ensure_ascii=False))
+        fp.write("]}")
+
+
+def serve(directory: Path) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = directory / self.path.lstrip("/")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(path.stat().st_size))
+            self.end_headers()
+            with open(path, "rb") as fp:
+                while chunk := fp.read(64 * 1024):
+                    self.wfile.write(chunk)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def child(url: str, stream: bool):
+    from npi_schedule import Client
+
+    client = Client(use_cache=False, stream=stream)
+    client.student_schedule_api.url = url
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    lessons = client.student_schedule("ИСПа", "F", 1, dates=REQUESTED_DATE)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss в Linux — в килобайтах
+    print(json.dumps({"peak_kb": peak - before, "lessons": len(lessons)}))
+
+
+def measure(url: str, stream: bool) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", url] + (["--stream"] if stream else []),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="5000,50000,200000", help="Количество занятий через запятую")
+    parser.add_argument("--child", metavar="URL", help="Внутренний режим: один замер")
+    parser.add_argument("--stream", action="store_true", help="Для --child: потоковый разбор")
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.stream)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        server = serve(directory)
+        base_url = "http://127.0.0.1:%d/" % server.server_address[1]
+
+        print("%10s %12s %16s %16s %10s" % ("Занятий", "Ответ, МБ", "Обычный, МБ", "Поток, МБ", "На дату"))
+        for size in (int(value) for value in args.sizes.split(",")):
+            name = "%d.json" % size
+            write_payload(directory / name, size)
+
+            buffered = measure(base_url + name, False)
+            streamed = measure(base_url + name, True)
+            assert buffered["lessons"] == streamed["lessons"]
+
+            print(
+                "%10d %12.1f %16.1f %16.1f %10d"
+                % (
+                    size,
+                    (directory / name).stat().st_size / 2**20,
+                    buffered["peak_kb"] / 1024,
+                    streamed["peak_kb"] / 1024,
+                    streamed["lessons"],
+                )
+            )
+
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
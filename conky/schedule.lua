@@ -9,8 +9,8 @@ conky.text = [[
 ${color0}Расписание в колледже группы '${color}ИСПа${color0}'
 $hr
 ${color0}На сегодня
-${color}${exec cat ~/.config/schedule/today}
+${color}${exec cat ~/.config/schedule/days/$(date +%F).txt 2>/dev/null}
 $hr
 ${color0}На завтра
-${color}${exec cat ~/.config/schedule/tomorrow}
+${color}${exec cat ~/.config/schedule/days/$(date -d tomorrow +%F).txt 2>/dev/null}
 ]]
@@ -17,25 +17,106 @@ DraggableDesktopWidget {
     property string todayContent: "Загрузка..."
     property string tomorrowContent: "Загрузка..."
 
+    // ETag последнего полученного ответа: сервер держит запрос открытым,
+    // пока файл не изменится, и отвечает 304, если изменений не было
+    property var etags: ({})
+    // Файлы, которых нет (дата вне семестра): сервер держит ?wait, пока файл не появится
+    property var missingPaths: ({})
+    property var pendingRetries: ({})
+    // Не больше MAX_WAIT в schedule-httpd
+    property int longPollSeconds: 600
+    // Повтор, если сервер недоступен или не умеет long-poll, — как прежний опрос раз в 5 минут
+    property int retryInterval: 300000
+
     implicitWidth: Math.round((contentLayout.implicitWidth + 10) * widgetScale)
     implicitHeight: Math.round(contentLayout.implicitHeight * widgetScale)
 
-    function loadSchedule(filePath, targetProperty) {
+    // Файл расписания на дату со сдвигом offsetDays от сегодняшней (days/ГГГГ-ММ-ДД.txt)
+    function dayPath(offsetDays) {
+        var date = new Date();
+        date.setDate(date.getDate() + offsetDays);
+        return serverUrl + "days/" + Qt.formatDate(date, "yyyy-MM-dd") + ".txt";
+    }
+
+    function loadSchedule(pathProperty, targetProperty) {
+        var filePath = root[pathProperty];
+        var waitForFile = root.missingPaths[targetProperty] === filePath;
+        var startedAt = Date.now();
         var xhr = new XMLHttpRequest();
         xhr.onreadystatechange = function() {
-            if (xhr.readyState === XMLHttpRequest.DONE) {
-                if (xhr.status === 200 || xhr.status === 0) {
-                    var text = xhr.responseText.trim();
-                    root[targetProperty] = text === "" ? "Нет событий" : text;
-                } else {
-                    root[targetProperty] = "Ошибка загрузки\n" + filePath;
-                }
+            if (xhr.readyState !== XMLHttpRequest.DONE) {
+                return;
+            }
+
+            // Дата сменилась, пока запрос висел, — эту цепочку запросов заменила новая
+            if (filePath !== root[pathProperty]) {
+                return;
+            }
+
+            if (xhr.status === 200) {
+                var text = xhr.responseText.trim();
+                root[targetProperty] = text === "" ? "Нет событий" : text;
+                root.etags[targetProperty] = xhr.getResponseHeader("ETag") || "";
+                delete root.missingPaths[targetProperty];
+            } else if (xhr.status === 404) {
+                // Файла нет — дата вне семестра
+                root[targetProperty] = "Нет событий";
+                root.etags[targetProperty] = "";
+            } else if (xhr.status !== 304) {
+                root[targetProperty] = "Ошибка загрузки\n" + filePath;
+                root.etags[targetProperty] = "";
+            }
+
+            // 404 сразу на ?wait — сервер не ждёт появления файла, тогда повтор по таймеру
+            var waitedForFile = waitForFile && Date.now() - startedAt >= root.longPollSeconds * 1000 / 2;
+
+            if (root.etags[targetProperty]) {
+                loadSchedule(pathProperty, targetProperty);
+            } else if (xhr.status === 404 && (!waitForFile || waitedForFile)) {
+                // Дальше ждём появления файла long-poll-ом
+                root.missingPaths[targetProperty] = filePath;
+                loadSchedule(pathProperty, targetProperty);
+            } else {
+                // Ошибка или сервер без long-poll — повтор по таймеру
+                scheduleRetry(pathProperty, targetProperty);
             }
         };
-        xhr.open("GET", filePath, true);
+
+        var etag = root.etags[targetProperty];
+        var wait = etag || waitForFile;
+        xhr.open("GET", wait ? filePath + "?wait=" + root.longPollSeconds : filePath, true);
+        if (etag) {
+            xhr.setRequestHeader("If-None-Match", etag);
+        }
         xhr.send();
     }
 
+    function scheduleRetry(pathProperty, targetProperty) {
+        root.pendingRetries[targetProperty] = pathProperty;
+        if (!retryTimer.running) {
+            retryTimer.start();
+        }
+    }
+
+    function loadAll() {
+        todayPath = dayPath(0);
+        tomorrowPath = dayPath(1);
+        etags = {};
+        missingPaths = {};
+        // Отложенный повтор запустил бы вторую цепочку запросов для той же даты
+        pendingRetries = {};
+        retryTimer.stop();
+
+        loadSchedule("todayPath", "todayContent");
+        loadSchedule("tomorrowPath", "tomorrowContent");
+    }
+
+    function msecsUntilMidnight() {
+        var midnight = new Date();
+        midnight.setHours(24, 0, 5, 0);
+        return midnight - new Date();
+    }
+
     function initSettings() {
         Logger.d('==============Init Sttings================')
         Logger.d(pluginApi)
@@ -49,23 +130,36 @@ DraggableDesktopWidget {
         var port = pluginApi.pluginSettings.serverPort || 8501;
         serverUrl = "http://127.0.0.1:" + port + "/";
         Logger.d("ServerURL: " + serverUrl)
-        todayPath = serverUrl + "today";
-        tomorrowPath = serverUrl + "tomorrow";
     }
 
     Component.onCompleted: {
         initSettings();
-        loadSchedule(root.todayPath, "todayContent");
-        loadSchedule(root.tomorrowPath, "tomorrowContent");
+        loadAll();
+    }
+
+    // Повтор после ошибки (сервер ещё не запущен и т.п.)
+    Timer {
+        id: retryTimer
+        interval: root.retryInterval
+        repeat: false
+        onTriggered: {
+            var retries = root.pendingRetries;
+            root.pendingRetries = {};
+            for (var targetProperty in retries) {
+                loadSchedule(retries[targetProperty], targetProperty);
+            }
+        }
     }
 
+    // В полночь переключаемся на файлы новых «сегодня» и «завтра»
     Timer {
-        interval: 60000 * 5
+        interval: root.msecsUntilMidnight()
         running: true
-        repeat: true
+        repeat: false
         onTriggered: {
-            loadSchedule(root.todayPath, "todayContent");
-            loadSchedule(root.tomorrowPath, "tomorrowContent");
+            loadAll();
+            interval = root.msecsUntilMidnight();
+            start();
         }
     }
 
@@ -0,0 +1,10 @@
+"""Расписание пар НПИ: библиотека и CLI `npi-schedule`."""
+from .cache import ResponseCache
+from .client import AsyncClient, Client
+from .directories import UnknownNameError
+from .models import Lesson, build_timeline, filter_lessons
+
+__all__ = [
+    "AsyncClient", "Client", "Lesson", "ResponseCache", "UnknownNameError", "build_timeline",
+    "filter_lessons",
+]
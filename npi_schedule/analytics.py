@@ -0,0 +1,158 @@
+from typing import Iterable
+
+import numpy as np
+import pandas
+
+from .models import Lesson
+from .utils import TIMES
+
+PAIRS = len(TIMES)
+# Занятия идут с понедельника по субботу
+WEEKMASK = "1111110"
+WEEKDAYS = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
+
+
+def date_range(start: str, end: str) -> np.ndarray:
+    return np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+
+
+def lessons_bounds(schedules: Iterable[list[Lesson]]) -> tuple[str, str] | None:
+    dates = [date for lessons in schedules for lesson in lessons for date in lesson.dates]
+    if not dates:
+        return None
+
+    return min(dates), max(dates)
+
+
+def weekdays(dates: np.ndarray) -> np.ndarray:
+    # 1970-01-01 — четверг, сдвигаем так, чтобы понедельник был 0
+    return (dates.astype("int64") + 3) % 7
+
+
+def occupancy_matrix(lessons: Iterable[Lesson], dates: np.ndarray) -> np.ndarray:
+    """Матрица занятости дата x пара (bool) для одного расписания."""
+    matrix = np.zeros((len(dates), PAIRS), dtype=bool)
+
+    lesson_dates = []
+    pairs = []
+    for lesson in lessons:
+        if lesson.pair not in TIMES:
+            continue
+
+        lesson_dates.extend(lesson.dates)
+        pairs.extend([lesson.pair - 1] * len(lesson.dates))
+
+    if not lesson_dates or not len(dates):
+        return matrix
+
+    lesson_dates = np.array(lesson_dates, dtype="datetime64[D]")
+    pairs = np.array(pairs)
+
+    index = np.searchsorted(dates, lesson_dates)
+    in_range = index < len(dates)
+    in_range[in_range] = dates[index[in_range]] == lesson_dates[in_range]
+
+    matrix[index[in_range], pairs[in_range]] = True
+    return matrix
+
+
+def occupancy_cube(schedules: dict[str, list[Lesson]], dates: np.ndarray) -> np.ndarray:
+    """Стек матриц занятости: расписание x дата x пара."""
+    if not schedules:
+        return np.zeros((0, len(dates), PAIRS), dtype=bool)
+
+    return np.stack([occupancy_matrix(lessons, dates) for lessons in schedules.values()])
+
+
+def room_utilisation(names: list[str], cube: np.ndarray, dates: np.ndarray) -> pandas.DataFrame:
+    working = np.is_busday(dates, weekmask=WEEKMASK)
+    slots = int(working.sum()) * PAIRS
+
+    occupied = cube[:, working].sum(axis=(1, 2))
+    utilisation = occupied / slots * 100 if slots else np.zeros(len(names))
+
+    return pandas.DataFrame(
+        {
+            "Аудитория": names,
+            "Занято пар": occupied,
+            "Всего пар": slots,
+            "Загрузка, %": utilisation.round(1),
+        }
+    ).sort_values("Загрузка, %", ascending=False, kind="stable")
+
+
+def peak_slots(cube: np.ndarray, dates: np.ndarray, top: int = 10) -> pandas.DataFrame:
+    """Самые загруженные сочетания день недели x пара по всем аудиториям."""
+    day_of_week = weekdays(dates)
+
+    busy = np.zeros((7, PAIRS))
+    np.add.at(busy, day_of_week, cube.sum(axis=0))
+
+    available = np.bincount(day_of_week, minlength=7)[:, None] * len(cube)
+    utilisation = np.divide(busy, available, out=np.zeros_like(busy), where=available > 0) * 100
+
+    order = np.argsort(-utilisation, axis=None, kind="stable")[:top]
+    day_index, pair_index = np.unravel_index(order, utilisation.shape)
+    mask = utilisation[day_index, pair_index] > 0
+
+    return pandas.DataFrame(
+        {
+            "День": [WEEKDAYS[day] for day in day_index[mask]],
+            "Пара": pair_index[mask] + 1,
+            "Начало": [TIMES[pair + 1] for pair in pair_index[mask]],
+            "Загрузка, %": utilisation[day_index, pair_index][mask].round(1),
+        }
+    )
+
+
+def week_index(dates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Понедельники недель и номер недели для каждой даты."""
+    mondays = dates - weekdays(dates).astype("timedelta64[D]")
+    return np.unique(mondays, return_inverse=True)
+
+
+def lecturer_workload(names: list[str], cube: np.ndarray, dates: np.ndarray) -> pandas.DataFrame:
+    weeks, inverse = week_index(dates)
+    one_hot = inverse[:, None] == np.arange(len(weeks))
+
+    weekly = cube.sum(axis=2) @ one_hot
+
+    data_frame = pandas.DataFrame(weekly, columns=[str(week) for week in weeks])
+    data_frame.insert(0, "Преподаватель", names)
+    data_frame["Всего"] = weekly.sum(axis=1)
+    data_frame["Макс. в неделю"] = weekly.max(axis=1, initial=0)
+
+    return data_frame
+
+
+def workload_histogram(cube: np.ndarray, dates: np.ndarray) -> pandas.DataFrame:
+    """Сколько раз (преподаватель, неделя) приходилось на N пар в неделю."""
+    weeks, inverse = week_index(dates)
+    one_hot = inverse[:, None] == np.arange(len(weeks))
+
+    weekly = (cube.sum(axis=2) @ one_hot).ravel()
+    counts = np.bincount(weekly, minlength=1)
+
+    return pandas.DataFrame({"Пар в неделю": np.arange(len(counts)), "Недель": counts})
+
+
+def build_report(
+    auditoriums: dict[str, list[Lesson]],
+    lecturers: dict[str, list[Lesson]],
+    start: str,
+    end: str,
+) -> dict[str, pandas.DataFrame]:
+    dates = date_range(start, end)
+    report = {}
+
+    if auditoriums:
+        cube = occupancy_cube(auditoriums, dates)
+        report["auditoriums"] = room_utilisation(list(auditoriums), cube, dates)
+        report["peak_slots"] = peak_slots(cube, dates)
+
+    if lecturers:
+        cube = occupancy_cube(lecturers, dates)
+        report["lecturers"] = lecturer_workload(list(lecturers), cube, dates)
+        report["workload_histogram"] = workload_histogram(cube, dates)
+
+    return report
@@ -0,0 +1,62 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "npi-schedule"
+DEFAULT_TTL = 60 * 60
+
+
+class ResponseCache:
+    """Файловый кэш JSON-ответов API, общий для CLI и библиотеки.
+
+    Ключ — полный URL запроса, запись устаревает через `ttl` секунд.
+    """
+
+    def __init__(self, directory: str | Path = CACHE_DIR, ttl: float = DEFAULT_TTL) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return self.directory / (key + ".json")
+
+    def age(self, url: str) -> float | None:
+        """Возраст записи в секундах, None — записи нет."""
+        try:
+            return time.time() - self._path(url).stat().st_mtime
+        except OSError:
+            return None
+
+    def get(self, url: str) -> Any | None:
+        path = self._path(url)
+
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+
+            with open(path, encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, url: str, data: Any) -> None:
+        path = self._path(url)
+        # Пишут и потоки AsyncClient/student_timeline, поэтому временный файл свой у каждого
+        tmp_path = path.with_suffix(".tmp%d-%d" % (os.getpid(), threading.get_ident()))
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump(data, fp, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Кэш — не критичная часть, без него просто будет лишний запрос
+            tmp_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
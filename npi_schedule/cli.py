@@ -0,0 +1,182 @@
+import os
+from argparse import ArgumentParser, Namespace
+
+import requests
+
+from .cli_methods import (AnalyticsCliMethod, AuditoriumsScheduleCliMethod,
+                          AuditoriumsSearchCliMethod,
+                          LecturersScheduleCliMethod, LecturersSearchCliMethod,
+                          StudentScheduleCliMethod)
+from .client import Client
+from .core import CliMethod
+from .directories import UnknownNameError
+from .metrics import METRICS_FILE_ENV, write_metrics
+from .printers import (MAIN_LAYOUT, AnalyticsPrinter, AuditoriumsPrinter,
+                       Layout, ListPrinter, SchedulePrinter)
+from .utils import (NOW_DATE, SUBCOMMANDS_ALIASES, add_argument_max_col_width,
+                    set_global_max_col_width)
+
+
+def get_metrics_query(args: Namespace) -> str:
+    if getattr(args, "export", None):
+        return "export"
+
+    if getattr(args, "tomorrow", False):
+        return "tomorrow"
+
+    if getattr(args, "date", None) == NOW_DATE:
+        return "today"
+
+    return getattr(args, "function", None) or "date"
+
+
+class Main:
+    def __init__(self, layout: Layout = MAIN_LAYOUT, client: Client | None = None) -> None:
+        self.layout = layout
+        self.parser = self.create_parser(layout)
+        self.create_subparsers()
+
+        self.client = client or Client()
+
+        list_printer = ListPrinter()
+        schedule_printer = SchedulePrinter(layout)
+        auditoriums_printer = AuditoriumsPrinter(layout)
+        analytics_printer = AnalyticsPrinter()
+
+        self.cli_methods = {
+            SUBCOMMANDS_ALIASES[0]: StudentScheduleCliMethod.factory(
+                self.subparsers, self.client, schedule_printer
+            ),
+            SUBCOMMANDS_ALIASES[1]: {
+                "search": LecturersSearchCliMethod.factory(
+                    self.lecturers_subparsers, self.client, list_printer
+                ),
+                "schedule": LecturersScheduleCliMethod.factory(
+                    self.lecturers_subparsers, self.client, schedule_printer
+                ),
+            },
+            SUBCOMMANDS_ALIASES[2]: {
+                "search": AuditoriumsSearchCliMethod.factory(
+                    self.auditoriums_subparsers, self.client, auditoriums_printer
+                ),
+                "schedule": AuditoriumsScheduleCliMethod.factory(
+                    self.auditoriums_subparsers, self.client, schedule_printer
+                ),
+            },
+            SUBCOMMANDS_ALIASES[3]: AnalyticsCliMethod.factory(
+                self.subparsers, self.client, analytics_printer
+            ),
+        }
+
+    @staticmethod
+    def create_parser(layout: Layout):
+        parser = ArgumentParser("npi-schedule", description="Расписание пар НПИ")
+        add_argument_max_col_width(parser, layout.max_col_width)
+        parser.add_argument(
+            "--no-cache",
+            help="Не использовать кэш ответов API",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--metrics-file",
+            help="Файл для метрик в формате Prometheus (node-exporter textfile), по умолчанию $"
+            + METRICS_FILE_ENV,
+            default=os.getenv(METRICS_FILE_ENV),
+        )
+        parser.add_argument(
+            "--no-validate",
+            help="Не проверять группу, лектора и аудиторию по локальным справочникам",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--stream",
+            help="Разбирать ответ API потоком, сохраняя только занятия на запрошенные даты",
+            action="store_true",
+            default=False,
+        )
+
+        return parser
+
+    def create_subparsers(self):
+        self.subparsers = self.parser.add_subparsers(dest="subcommand")
+
+        lecturers_parser = self.subparsers.add_parser(
+            SUBCOMMANDS_ALIASES[1][0], aliases=SUBCOMMANDS_ALIASES[1][1:]
+        )
+        add_argument_max_col_width(lecturers_parser)
+        self.lecturers_subparsers = lecturers_parser.add_subparsers(
+            dest="function", required=True, help="Действия с лекторами"
+        )
+
+        auditoriums_parser = self.subparsers.add_parser(
+            SUBCOMMANDS_ALIASES[2][0], aliases=SUBCOMMANDS_ALIASES[2][1:]
+        )
+        add_argument_max_col_width(auditoriums_parser)
+        self.auditoriums_subparsers = auditoriums_parser.add_subparsers(
+            dest="function", required=True, help="Действия с аудиториями"
+        )
+
+    def get_method(self, args: Namespace) -> CliMethod | None:
+        for aliases, method_or_dict in self.cli_methods.items():
+            if args.subcommand not in aliases:
+                continue
+
+            if isinstance(method_or_dict, CliMethod):
+                return method_or_dict
+
+            if isinstance(method_or_dict, dict):
+                method = method_or_dict.get(args.function)
+                if method is None:
+                    raise ValueError(args.function + " не найден в cli_methods")
+
+                return method
+
+            raise ValueError("В cli_methods словаре должны находиться Factory or dict")
+
+        return None
+
+    def run(self, args: Namespace):
+        method = self.get_method(args)
+        if method is not None:
+            method(args)
+
+    def start(self, argv: list[str] | None = None):
+        args = self.parser.parse_args(argv)
+
+        set_global_max_col_width(args.max_col_width, self.layout.global_max_col_width)
+        if args.no_cache:
+            self.client.disable_cache()
+        if args.no_validate:
+            self.client.directories = None
+        if args.stream:
+            self.client.stream = True
+
+        try:
+            self.run_with_metrics(args)
+        except UnknownNameError as error:
+            self.parser.error(str(error))
+        except requests.HTTPError as error:
+            self.parser.exit(1, "%s: ошибка API: %s\n" % (self.parser.prog, error))
+
+    def run_with_metrics(self, args: Namespace):
+        if not args.metrics_file:
+            self.run(args)
+            return
+
+        try:
+            self.run(args)
+        except Exception:
+            write_metrics(self.client.metrics, args.metrics_file, get_metrics_query(args), False)
+            raise
+
+        write_metrics(self.client.metrics, args.metrics_file, get_metrics_query(args), True)
+
+
+def main():
+    Main().start()
+
+
+if __name__ == "__main__":
+    main()
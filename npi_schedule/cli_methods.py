@@ -0,0 +1,305 @@
+import asyncio
+from argparse import Namespace, RawTextHelpFormatter
+from pathlib import Path
+from typing import Any
+
+from .analytics import build_report, lessons_bounds
+from .client import AsyncClient
+from .core import CliMethod
+from .export import export_lessons
+from .models import Lesson, Timeline, build_timeline, lessons_from_response
+from .utils import (FACULTIES, NOW_DATE, SUBCOMMANDS_ALIASES, add_argument_date,
+                    add_argument_max_col_width, get_tomorrow_date, iso_date,
+                    split_list)
+
+
+class ScheduleMixin:
+    @staticmethod
+    def is_single_date(date: str) -> bool:
+        return "," not in date and ".." not in date
+
+    def _get_lesson(self, lesson: Lesson):
+        raise NotImplementedError()
+
+    def get_data(self, *url_args, dates: str | None = None, **url_kwargs):
+        return self.client.request(self.api_endpoint, *url_args, dates=dates, **url_kwargs)
+
+    def get_lessons(self, *url_args, dates: str | None = None, **url_kwargs) -> list[Lesson]:
+        return lessons_from_response(self.get_data(*url_args, dates=dates, **url_kwargs))
+
+    def print_timeline(
+        self,
+        timeline: Timeline,
+        date: str,
+        columns: list[str] | None = None,
+        title: str | None = None,
+    ):
+        self.client.metrics.lessons += sum(len(lessons) for lessons in timeline.values())
+        super().print(
+            timeline, columns or self.COLUMNS, self._get_lesson, not self.is_single_date(date), title
+        )
+
+    def print(
+        self,
+        lessons: list[Lesson],
+        date: str,
+        columns: list[str] | None = None,
+        title: str | None = None,
+    ):
+        self.print_timeline(build_timeline(lessons, date), date, columns, title)
+
+
+class StudentScheduleCliMethod(ScheduleMixin, CliMethod):
+    ALIASES = SUBCOMMANDS_ALIASES[0]
+    COLUMNS = ["Начало", "Аудитория", "Дисциплина", "Преподаватель"]
+    FINALS_COLUMNS = ["Период", "Аудитория", "Дисциплина", "Преподаватель"]
+    TIMELINE_COLUMNS = ["Время", "Аудитория", "Дисциплина", "Преподаватель"]
+
+    def __call__(self, args: Namespace) -> Any:
+        date = get_tomorrow_date() if getattr(args, "tomorrow", False) else args.date
+        args.group = self.check_name("group", args.group, args.facult, args.course)
+        group_args = (args.group, args.facult, args.course)
+
+        if args.export:
+            self.export(*group_args, args.export, args.finals_schedule)
+        elif args.finals_schedule:
+            lessons = self.client.student_finals(*group_args, dates=date)
+            self.print(lessons, date, self.FINALS_COLUMNS)
+        elif args.with_finals:
+            # Обычное расписание и зачётная неделя запрашиваются параллельно
+            timeline = self.client.student_timeline(*group_args, dates=date)
+            self.print_timeline(timeline, date, self.TIMELINE_COLUMNS)
+        else:
+            lessons = self.get_lessons(
+                group=args.group, facult=args.facult, course=args.course, dates=date
+            )
+            self.print(lessons, date)
+
+    def export(self, group: str, facult: str, course: int | str, directory: str, is_finals: bool):
+        if is_finals:
+            lessons = self.client.student_finals(group, facult, course)
+            columns = self.FINALS_COLUMNS
+        else:
+            lessons = self.client.student_schedule(group, facult, course)
+            columns = self.COLUMNS
+
+        self.client.metrics.lessons += export_lessons(
+            lessons,
+            Path(directory) / ("finals" if is_finals else "days"),
+            columns,
+            self._get_lesson,
+            {"group": group, "facult": facult, "course": str(course), "finals": is_finals},
+        )
+
+    def _add_args(self):
+        epilog = "Список кодов факультетов (-f):\n" + "\n".join(
+            [
+                key + " - " + value["code"] + " - " + value["name"]
+                for key, value in FACULTIES.items()
+            ]
+        )
+
+        student_parser = self.subparsers.add_parser(
+            self.ALIASES[0],
+            description="Расписание для студентов",
+            aliases=self.ALIASES[1:],
+            epilog=epilog,
+            formatter_class=RawTextHelpFormatter,
+        )
+        student_parser.add_argument("-g", "--group", help="Группа", required=True)
+        student_parser.add_argument(
+            "-f", "--facult", help="Факультет", choices=FACULTIES.keys(), required=True
+        )
+        student_parser.add_argument("-c", "--course", help="Курс", default=1)
+        student_parser.add_argument("-0", "--finals-schedule", action="store_true", help="Расписание зачетной недели", default=False)
+        student_parser.add_argument(
+            "-F",
+            "--with-finals",
+            action="store_true",
+            help="Обычное расписание вместе с зачетной неделей одной лентой",
+            default=False,
+        )
+        student_parser.add_argument("-t", "--tomorrow", action="store_true", help="Расписание на завтра", default=False)
+        student_parser.add_argument(
+            "-e",
+            "--export",
+            metavar="DIR",
+            help="Записать расписание на весь семестр по файлу на дату (DIR/days/ГГГГ-ММ-ДД.{txt,json} и manifest.json)",
+        )
+        add_argument_date(student_parser)
+        add_argument_max_col_width(student_parser)
+
+    def _get_lesson(self, lesson: Lesson):
+        return [lesson.period, lesson.auditorium, lesson.title, lesson.lecturer]
+
+    @classmethod
+    def factory(cls, subparsers, client, schedule_printer):
+        return cls(subparsers, client, client.student_schedule_api, schedule_printer)
+
+
+class LecturersSearchCliMethod(CliMethod):
+    def __call__(self, args: Namespace) -> Any:
+        data = self.get_data(args.query)
+        self.print(data)
+
+    def _add_args(self):
+        lecturer_search_parser = self.subparsers.add_parser("search", help="Поиск лектора")
+        lecturer_search_parser.add_argument(
+            "query", help="Фамилия или часть фамилии для поиска"
+        )
+        add_argument_max_col_width(lecturer_search_parser)
+
+    @classmethod
+    def factory(cls, subparsers, client, list_printer):
+        return cls(subparsers, client, client.lecturers_search_api, list_printer)
+
+
+class LecturersScheduleCliMethod(ScheduleMixin, CliMethod):
+    COLUMNS = ["Начало", "Аудитория", "Дисциплина", "Группы"]
+
+    def __call__(self, args: Namespace) -> Any:
+        args.lecturer = self.check_name("lecturer", args.lecturer)
+        data = self.get_data(args.lecturer, dates=args.date)
+        title = "Лектор: " + data.get("lecturer", args.lecturer)
+        self.print(lessons_from_response(data), args.date, title=title)
+
+    def _add_args(self):
+        lector_schedule_parser = self.subparsers.add_parser(
+            "schedule", help="Получение расписания лектора"
+        )
+        lector_schedule_parser.add_argument(
+            "lecturer",
+            help='Фамилия и инициалы лектора в формате "Фамилия И О" (без точек)',
+        )
+        add_argument_date(lector_schedule_parser)
+        add_argument_max_col_width(lector_schedule_parser)
+
+    def _get_lesson(self, lesson: Lesson):
+        return [lesson.period, lesson.auditorium, lesson.title, list(lesson.groups)]
+
+    @classmethod
+    def factory(cls, subparsers, client, schedule_printer):
+        return cls(subparsers, client, client.lecturer_schedule_api, schedule_printer)
+
+
+class AuditoriumsSearchCliMethod(CliMethod):
+    def __call__(self, args: Namespace) -> Any:
+        data = self.get_data(args.query)
+        self.print(data)
+
+    def _add_args(self):
+        auditorium_search_parser = self.subparsers.add_parser(
+            "search", help="Поиск аудитории"
+        )
+        auditorium_search_parser.add_argument(
+            "query", help="Номер или часть номера для поиска"
+        )
+        add_argument_max_col_width(auditorium_search_parser)
+
+    @classmethod
+    def factory(cls, subparsers, client, auditoriums_printer):
+        return cls(subparsers, client, client.auditoriums_search_api, auditoriums_printer)
+
+
+class AuditoriumsScheduleCliMethod(ScheduleMixin, CliMethod):
+    COLUMNS = ["Начало", "Дисциплина", "Педагог", "Группы"]
+
+    def __call__(self, args: Namespace) -> Any:
+        args.auditorium = self.check_name("auditorium", args.auditorium)
+        lessons = self.get_lessons(args.auditorium, dates=args.date)
+        self.print(lessons, args.date)
+
+    def _add_args(self):
+        auditorium_schedule_parser = self.subparsers.add_parser(
+            "schedule", help="Получение расписания аудитории"
+        )
+        auditorium_schedule_parser.add_argument("auditorium", help="Аудитория")
+        add_argument_date(auditorium_schedule_parser)
+        add_argument_max_col_width(auditorium_schedule_parser)
+
+    def _get_lesson(self, lesson: Lesson):
+        return [lesson.period, lesson.title, lesson.lecturer, list(lesson.groups)]
+
+    @classmethod
+    def factory(cls, subparsers, client, schedule_printer):
+        return cls(subparsers, client, client.auditorium_schedule_api, schedule_printer)
+
+
+class AnalyticsCliMethod(CliMethod):
+    ALIASES = SUBCOMMANDS_ALIASES[3]
+
+    def __call__(self, args: Namespace) -> Any:
+        auditoriums = split_list(args.auditoriums)
+        lecturers = split_list(args.lecturers)
+        if not auditoriums and not lecturers:
+            self.parser.error("нужно указать хотя бы одну аудиторию (-a) или лектора (-l)")
+
+        auditoriums = [self.check_name("auditorium", name) for name in auditoriums]
+        lecturers = [self.check_name("lecturer", name) for name in lecturers]
+
+        auditorium_schedules, lecturer_schedules = self.get_data(auditoriums, lecturers)
+
+        bounds = lessons_bounds(
+            [*auditorium_schedules.values(), *lecturer_schedules.values()]
+        )
+        start = args.start or (bounds[0] if bounds else NOW_DATE)
+        end = args.end or (bounds[1] if bounds else NOW_DATE)
+        if start > end:
+            self.parser.error("начало периода %s позже конца %s" % (start, end))
+
+        report = build_report(auditorium_schedules, lecturer_schedules, start, end)
+        self.print(report, args.format, args.output)
+
+    def get_data(self, auditoriums: list[str], lecturers: list[str]):
+        async def load():
+            async with AsyncClient(self.client) as async_client:
+                results = await asyncio.gather(
+                    *(async_client.auditorium_schedule(name) for name in auditoriums),
+                    *(async_client.lecturer_schedule(name) for name in lecturers),
+                )
+
+            return (
+                dict(zip(auditoriums, results[: len(auditoriums)])),
+                dict(zip(lecturers, results[len(auditoriums) :])),
+            )
+
+        return asyncio.run(load())
+
+    def _add_args(self):
+        self.parser = self.subparsers.add_parser(
+            self.ALIASES[0],
+            description="Загрузка аудиторий и нагрузка преподавателей за период",
+            aliases=self.ALIASES[1:],
+        )
+        self.parser.add_argument(
+            "-a", "--auditoriums", help="Аудитории через запятую", default=""
+        )
+        self.parser.add_argument(
+            "-l",
+            "--lecturers",
+            help='Лекторы в формате "Фамилия И О" через запятую',
+            default="",
+        )
+        self.parser.add_argument(
+            "--start",
+            type=iso_date,
+            help="Начало периода (Year-month-day), по умолчанию первая дата в расписаниях",
+        )
+        self.parser.add_argument(
+            "--end",
+            type=iso_date,
+            help="Конец периода (Year-month-day), по умолчанию последняя дата в расписаниях",
+        )
+        self.parser.add_argument(
+            "--format", help="Формат вывода", choices=["table", "csv", "json"], default="table"
+        )
+        self.parser.add_argument(
+            "-o",
+            "--output",
+            help="Файл для json или каталог для csv (по таблице на файл), по умолчанию stdout",
+        )
+        add_argument_max_col_width(self.parser)
+
+    @classmethod
+    def factory(cls, subparsers, client, analytics_printer):
+        return cls(subparsers, client, client.auditorium_schedule_api, analytics_printer)
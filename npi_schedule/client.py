@@ -0,0 +1,236 @@
+"""Библиотечный доступ к API расписания НПИ.
+
+Пример::
+
+    from npi_schedule import AsyncClient, Client
+
+    with Client() as client:
+        lessons = client.student_schedule("ИСПа", "F", 3, dates="2025-09-01")
+
+    async with AsyncClient() as client:
+        first, second = await asyncio.gather(
+            client.lecturer_schedule("Иванов И И"),
+            client.auditorium_schedule("310ГЛ"),
+        )
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import ResponseCache
+from .core import REQUEST_TIMEOUT, ApiEndpoint
+from .directories import DIRECTORY_TTL, Directories
+from .metrics import FetchMetrics
+from .models import (Lesson, Timeline, build_timeline, filter_lessons, json_on_dates,
+                     lessons_from_response)
+
+DEFAULT_POOL_SIZE = 10
+
+Dates = str | Iterable[str] | None
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+class Client:
+    """Синхронный клиент API.
+
+    Все запросы идут через одну `requests.Session` (пул соединений
+    переиспользуется) и через тот же файловый кэш, что и у CLI.
+    Методы расписаний возвращают список `Lesson`, при указании `dates`
+    (строка через запятую или итерируемое) — только занятия на эти даты.
+    Вместе с кэшем включены справочники `directories` для проверки
+    групп, лекторов и аудиторий без запроса расписания.
+
+    С `stream=True` расписания с `dates` разбираются потоком
+    (`ApiEndpoint.stream`): занятия на другие даты отбрасываются сразу,
+    и память не растёт с размером ответа.
+
+    Каждый запрос ждёт ответа не дольше `timeout` секунд.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        use_cache: bool = True,
+        session: requests.Session | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        metrics: FetchMetrics | None = None,
+        stream: bool = False,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> None:
+        self.session = session or create_session(pool_size)
+        self.stream = stream
+        self.timeout = timeout
+        self.cache = (cache or ResponseCache()) if use_cache else None
+        self.metrics = metrics or FetchMetrics()
+        self.directories = (
+            Directories(self, ResponseCache(self.cache.directory / "directories", DIRECTORY_TTL))
+            if self.cache is not None
+            else None
+        )
+
+        self.student_schedule_api = self._endpoint(
+            "v2/faculties/{facult}/years/{course}/groups/{group}/schedule"
+        )
+        self.student_finals_api = self._endpoint(
+            "v2/faculties/{facult}/years/{course}/groups/{group}/finals-schedule"
+        )
+        self.student_groups_api = self._endpoint("v2/faculties/{facult}/years/{course}/groups")
+        self.lecturer_schedule_api = self._endpoint("v2/lecturers/{}/schedule")
+        self.auditorium_schedule_api = self._endpoint("v2/auditoriums/{}/schedule")
+        self.lecturers_search_api = self._endpoint("v1/lecturers/{}")
+        self.auditoriums_search_api = self._endpoint("v1/auditoriums/{}")
+
+    def _endpoint(self, endpoint: str) -> ApiEndpoint:
+        return ApiEndpoint(endpoint, self.session, self.cache, self.metrics, self.timeout)
+
+    def disable_cache(self) -> None:
+        self.cache = None
+        self.directories = None
+        for value in vars(self).values():
+            if isinstance(value, ApiEndpoint):
+                value.cache = None
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def _lessons(data: dict | list[dict], dates: Dates) -> list[Lesson]:
+        return filter_lessons(lessons_from_response(data), dates)
+
+    def request(self, endpoint: ApiEndpoint, *url_args: Any, dates: Dates = None, **url_kwargs: Any) -> Any:
+        """Ответ API расписания; при `stream` и заданных `dates` — только с занятиями на эти даты."""
+        if self.stream and dates is not None:
+            return endpoint.stream(json_on_dates(dates), *url_args, **url_kwargs)
+
+        return endpoint(*url_args, **url_kwargs)
+
+    def student_schedule(
+        self, group: str, facult: str, course: int | str = 1, dates: Dates = None
+    ) -> list[Lesson]:
+        data = self.request(
+            self.student_schedule_api, group=group, facult=facult, course=course, dates=dates
+        )
+        return self._lessons(data, dates)
+
+    def student_finals(
+        self, group: str, facult: str, course: int | str = 1, dates: Dates = None
+    ) -> list[Lesson]:
+        data = self.request(
+            self.student_finals_api, group=group, facult=facult, course=course, dates=dates
+        )
+        return self._lessons(data, dates)
+
+    def student_timeline(
+        self, group: str, facult: str, course: int | str = 1, dates: Dates = None
+    ) -> Timeline:
+        """Обычные занятия и зачётная неделя одной лентой: дата -> занятия по времени."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            regular = executor.submit(self.student_schedule, group, facult, course, dates)
+            finals = executor.submit(self.student_finals, group, facult, course, dates)
+
+            return build_timeline([*regular.result(), *finals.result()], dates)
+
+    def student_groups(self, facult: str, course: int | str = 1) -> list[str]:
+        return list(self.student_groups_api(facult=facult, course=course))
+
+    def lecturer_schedule(self, lecturer: str, dates: Dates = None) -> list[Lesson]:
+        data = self.request(self.lecturer_schedule_api, lecturer, dates=dates)
+        return self._lessons(data, dates)
+
+    def auditorium_schedule(self, auditorium: str, dates: Dates = None) -> list[Lesson]:
+        data = self.request(self.auditorium_schedule_api, auditorium, dates=dates)
+        return self._lessons(data, dates)
+
+    def search_lecturers(self, query: str) -> list[str]:
+        return list(self.lecturers_search_api(query))
+
+    def search_auditoriums(self, query: str) -> dict[str, list[tuple[str, str]]]:
+        data = self.auditoriums_search_api(query)
+        return {
+            corpus: [tuple(auditorium) for auditorium in auditoriums]
+            for corpus, auditoriums in data.items()
+        }
+
+
+class AsyncClient:
+    """asyncio-обёртка над `Client`.
+
+    Блокирующие запросы выполняются в пуле потоков размером с пул
+    соединений, поэтому несколько вызовов через `asyncio.gather`
+    действительно идут параллельно.
+    """
+
+    def __init__(self, client: Client | None = None, **client_kwargs: Any) -> None:
+        # Переданный извне клиент (например, общий с CLI) не закрываем
+        self._owns_client = client is None
+        self.client = client or Client(**client_kwargs)
+        pool_size = client_kwargs.get("pool_size", DEFAULT_POOL_SIZE)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size)
+
+    async def _run(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def student_schedule(
+        self, group: str, facult: str, course: int | str = 1, dates: Dates = None
+    ) -> list[Lesson]:
+        return await self._run(self.client.student_schedule, group, facult, course, dates)
+
+    async def student_finals(
+        self, group: str, facult: str, course: int | str = 1, dates: Dates = None
+    ) -> list[Lesson]:
+        return await self._run(self.client.student_finals, group, facult, course, dates)
+
+    async def student_timeline(
+        self, group: str, facult: str, course: int | str = 1, dates: Dates = None
+    ) -> Timeline:
+        regular, finals = await asyncio.gather(
+            self.student_schedule(group, facult, course, dates),
+            self.student_finals(group, facult, course, dates),
+        )
+
+        return build_timeline([*regular, *finals], dates)
+
+    async def student_groups(self, facult: str, course: int | str = 1) -> list[str]:
+        return await self._run(self.client.student_groups, facult, course)
+
+    async def lecturer_schedule(self, lecturer: str, dates: Dates = None) -> list[Lesson]:
+        return await self._run(self.client.lecturer_schedule, lecturer, dates)
+
+    async def auditorium_schedule(self, auditorium: str, dates: Dates = None) -> list[Lesson]:
+        return await self._run(self.client.auditorium_schedule, auditorium, dates)
+
+    async def search_lecturers(self, query: str) -> list[str]:
+        return await self._run(self.client.search_lecturers, query)
+
+    async def search_auditoriums(self, query: str) -> dict[str, list[tuple[str, str]]]:
+        return await self._run(self.client.search_auditoriums, query)
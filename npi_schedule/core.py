@@ -0,0 +1,145 @@
+import sys
+import time
+from argparse import Namespace, _SubParsersAction
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+import requests
+
+from .cache import ResponseCache
+from .metrics import FetchMetrics
+from .stream import CHUNK_SIZE, filter_response, load_filtered
+from .utils import API_URL
+
+# Секунды на соединение и на ожидание данных: зависший API не должен держать процесс
+REQUEST_TIMEOUT = 30
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+class ApiEndpoint:
+    API_URL = API_URL
+
+    def __init__(
+        self,
+        endpoint,
+        session: requests.Session | None = None,
+        cache: ResponseCache | None = None,
+        metrics: FetchMetrics | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> None:
+        self.url = self.API_URL + endpoint
+        self.session = session
+        self.cache = cache
+        self.metrics = metrics or FetchMetrics()
+        self.timeout = timeout
+
+    def format_url(self, *url_args, **url_kwargs: Any) -> str:
+        return self.url.format(*url_args, **url_kwargs)
+
+    def __call__(self, *url_args, **url_kwargs: Any) -> Any:
+        url = self.format_url(*url_args, **url_kwargs)
+
+        self.metrics.requests += 1
+        if self.cache is not None:
+            data = self.cache.get(url)
+            if data is not None:
+                self.metrics.cache_hits += 1
+                return data
+
+        start = time.monotonic()
+        response = (self.session or requests).get(url, timeout=self.timeout)
+        self.metrics.durations.append(time.monotonic() - start)
+        self.metrics.bytes += len(response.content)
+
+        response.raise_for_status()
+
+        data = response.json()
+        if self.cache is not None:
+            self.cache.set(url, data)
+
+        return data
+
+    def _count_bytes(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.metrics.bytes += len(chunk)
+            yield chunk
+
+    def stream(self, keep: Callable[[Any], bool], *url_args, **url_kwargs: Any) -> Any:
+        """Как вызов, но `classes` разбирается потоком и остаются только записи, прошедшие `keep`.
+
+        Ответ целиком в памяти не держится. Результат неполный, поэтому в кэш
+        не пишется, а уже закэшированный полный ответ просто фильтруется.
+        """
+        url = self.format_url(*url_args, **url_kwargs)
+
+        self.metrics.requests += 1
+        if self.cache is not None:
+            data = self.cache.get(url)
+            if data is not None:
+                self.metrics.cache_hits += 1
+                return filter_response(data, keep)
+
+        start = time.monotonic()
+        response = (self.session or requests).get(url, stream=True, timeout=self.timeout)
+        try:
+            response.raise_for_status()
+            data = load_filtered(self._count_bytes(response.iter_content(CHUNK_SIZE)), keep)
+        finally:
+            response.close()
+
+        # В отличие от обычного запроса, сюда входит и разбор: тело читается вместе с ним
+        self.metrics.durations.append(time.monotonic() - start)
+
+        return data
+
+
+class Printer:
+    def __call__(self, data: Any, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError()
+
+
+class CliMethod:
+    def __init__(
+        self,
+        subparsers: _SubParsersAction,
+        client: "Client",
+        api_endpoint: ApiEndpoint,
+        printer: Printer,
+    ) -> None:
+        self.subparsers = subparsers
+        self.client = client
+        self.api_endpoint = api_endpoint
+        self.printer = printer
+
+        self._add_args()
+
+    def __call__(self, args: Namespace) -> Any:
+        raise NotImplementedError()
+
+    def _add_args(self):
+        raise NotImplementedError()
+
+    def get_data(self, *url_args, **url_kwargs):
+        return self.api_endpoint(*url_args, **url_kwargs)
+
+    def print(self, data: Any, *args, **kwargs):
+        self.printer(data, *args, **kwargs)
+
+    def check_name(self, kind: str, value: str, *args) -> str:
+        """Проверка по локальному справочнику (`Directories.match_<kind>`) до запроса расписания."""
+        directories = self.client.directories
+        if directories is None:
+            return value
+
+        checked = getattr(directories, "match_" + kind)(value, *args)
+        if checked != value:
+            print("«%s» исправлено на «%s»" % (value, checked), file=sys.stderr)
+
+        return checked
+
+    @classmethod
+    def factory(
+        cls, subparsers: _SubParsersAction, client: "Client", printer: Printer
+    ) -> "CliMethod":
+        raise NotImplementedError()
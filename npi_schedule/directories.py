@@ -0,0 +1,205 @@
+import difflib
+import threading
+from typing import TYPE_CHECKING, Any, Callable
+
+import requests
+
+from .cache import ResponseCache
+from .core import ApiEndpoint
+
+if TYPE_CHECKING:
+    from .client import Client
+
+DIRECTORY_TTL = 30 * 24 * 60 * 60
+REFRESH_AFTER = 24 * 60 * 60
+MAX_SUGGESTIONS = 3
+
+
+class UnknownNameError(ValueError):
+    def __init__(self, message: str, value: str, suggestions: list[str]) -> None:
+        if suggestions:
+            message += ". Возможно: " + ", ".join(suggestions)
+
+        super().__init__(message)
+        self.value = value
+        self.suggestions = suggestions
+
+
+def normalize_name(value: str) -> str:
+    # "иванов и.и." и "Иванов И И" — одно и то же имя
+    return " ".join(value.replace(".", " ").split()).casefold()
+
+
+def match_name(value: str, names: list[str], message: str) -> str:
+    """Имя из справочника, совпадающее с `value` с точностью до регистра, точек и пробелов.
+
+    Если такого нет, бросает UnknownNameError с ближайшими вариантами.
+    """
+    if value in names:
+        return value
+
+    normalized = {}
+    for name in names:
+        normalized.setdefault(normalize_name(name), []).append(name)
+
+    same = normalized.get(normalize_name(value), [])
+    if len(same) == 1:
+        return same[0]
+
+    # Как difflib.get_close_matches, но при равной похожести сохраняется порядок справочника
+    matcher = difflib.SequenceMatcher(b=normalize_name(value))
+    ratios = {}
+    for key in normalized:
+        matcher.set_seq1(key)
+        ratios[key] = matcher.ratio()
+
+    close = sorted((key for key, ratio in ratios.items() if ratio >= 0.6), key=lambda key: -ratios[key])
+    suggestions = same or [name for key in close for name in normalized[key]]
+    raise UnknownNameError(message.format(value), value, suggestions[:MAX_SUGGESTIONS])
+
+
+def search_query(value: str) -> str:
+    return " ".join(value.replace(".", " ").split())
+
+
+def is_not_found(error: requests.HTTPError) -> bool:
+    # Поиск без результатов отвечает 404
+    return error.response is not None and error.response.status_code == 404
+
+
+def _names(data: Any) -> list[str]:
+    return [item if isinstance(item, str) else item.get("name", "") for item in data]
+
+
+def _auditorium_names(data: dict[str, list]) -> list[str]:
+    return [auditorium for auditoriums in data.values() for auditorium, _ in auditoriums]
+
+
+class Directories:
+    """Локальные справочники групп, лекторов и аудиторий.
+
+    Нужны, чтобы проверить аргументы до запроса расписания. Справочник
+    живёт в кэше `DIRECTORY_TTL` секунд; старше `refresh_after` — всё равно
+    используется сразу, а обновляется в фоновом потоке (не больше одного
+    на справочник). Если справочник получить не удалось, проверка пропускается.
+    """
+
+    def __init__(
+        self, client: "Client", cache: ResponseCache, refresh_after: float = REFRESH_AFTER
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self.refresh_after = refresh_after
+        self._lock = threading.Lock()
+        self._refreshing: dict[str, threading.Thread] = {}
+
+    def _fetch(self, url: str, endpoint: ApiEndpoint, convert: Callable, url_args: tuple, url_kwargs: dict):
+        names = convert(endpoint(*url_args, **url_kwargs))
+        self.cache.set(url, names)
+        return names
+
+    def _refresh(self, url: str, *args: Any):
+        try:
+            self._fetch(url, *args)
+        except (requests.RequestException, ValueError):
+            pass
+        finally:
+            with self._lock:
+                del self._refreshing[url]
+
+    def _load(self, endpoint: ApiEndpoint, convert: Callable, *url_args, **url_kwargs) -> list[str] | None:
+        url = endpoint.format_url(*url_args, **url_kwargs)
+        args = (url, endpoint, convert, url_args, url_kwargs)
+
+        names = self.cache.get(url)
+        if names is None:
+            try:
+                return self._fetch(*args)
+            except requests.HTTPError as error:
+                # Пустой справочник: имя не найдётся и будет отклонено
+                return [] if is_not_found(error) else None
+            except (requests.RequestException, ValueError):
+                return None
+
+        age = self.cache.age(url)
+        if age is not None and age > self.refresh_after:
+            with self._lock:
+                if url not in self._refreshing:
+                    # Не демон: процесс дождётся обновления справочника после вывода расписания
+                    thread = threading.Thread(target=self._refresh, args=args)
+                    self._refreshing[url] = thread
+                    thread.start()
+
+        return names
+
+    def wait(self):
+        with self._lock:
+            threads = list(self._refreshing.values())
+
+        for thread in threads:
+            thread.join()
+
+    def _search(self, endpoint: ApiEndpoint, convert: Callable, value: str) -> list[str] | None:
+        """Имена из поиска по полному значению; None — поиск не удался."""
+        try:
+            return convert(endpoint(search_query(value)))
+        except requests.HTTPError as error:
+            return [] if is_not_found(error) else None
+        except (requests.RequestException, ValueError):
+            return None
+
+    def _match_searched(
+        self, value: str, names: list[str], message: str, endpoint: ApiEndpoint, convert: Callable
+    ) -> str:
+        try:
+            return match_name(value, names, message)
+        except UnknownNameError as error:
+            # Справочник на первую букву — тоже результат поиска, и API мог его обрезать:
+            # отказываем, только если не находится и по полному имени
+            found = self._search(endpoint, convert, value)
+            if found is None:
+                return value
+
+            try:
+                return match_name(value, found, message)
+            except UnknownNameError:
+                raise error from None
+
+    def groups(self, facult: str, course: int | str) -> list[str] | None:
+        return self._load(self.client.student_groups_api, _names, facult=facult, course=course)
+
+    def lecturers(self, lecturer: str) -> list[str] | None:
+        # Поиск по первой букве фамилии: один справочник на всех лекторов на эту букву
+        return self._load(self.client.lecturers_search_api, _names, lecturer.strip()[:1].upper())
+
+    def auditoriums(self, auditorium: str) -> list[str] | None:
+        return self._load(self.client.auditoriums_search_api, _auditorium_names, auditorium.strip()[:1].upper())
+
+    def match_group(self, group: str, facult: str, course: int | str) -> str:
+        names = self.groups(facult, course)
+        if not names:
+            return group
+
+        return match_name(group, names, "Группа «{}» не найдена на факультете %s, курс %s" % (facult, course))
+
+    def match_lecturer(self, lecturer: str) -> str:
+        names = self.lecturers(lecturer)
+        if names is None:
+            return lecturer
+
+        return self._match_searched(
+            lecturer, names, "Лектор «{}» не найден", self.client.lecturers_search_api, _names
+        )
+
+    def match_auditorium(self, auditorium: str) -> str:
+        names = self.auditoriums(auditorium)
+        if names is None:
+            return auditorium
+
+        return self._match_searched(
+            auditorium,
+            names,
+            "Аудитория «{}» не найдена",
+            self.client.auditoriums_search_api,
+            _auditorium_names,
+        )
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+from .models import Lesson, build_timeline
+from .utils import format_data_frame
+
+
+def write_shard(path: Path, content: str, old_hash: str | None) -> str:
+    content_bytes = content.encode()
+    new_hash = hashlib.sha256(content_bytes).hexdigest()
+
+    # Неизменившиеся файлы не трогаем: меньше записей на диск и ETag у schedule-httpd не меняется
+    if new_hash != old_hash or not path.exists():
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(content_bytes)
+        os.replace(tmp_path, path)
+
+    return new_hash
+
+
+def date_span(first: str, last: str) -> list[str]:
+    current = datetime.strptime(first, "%Y-%m-%d")
+    end = datetime.strptime(last, "%Y-%m-%d")
+
+    dates = []
+    while current <= end:
+        dates.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+
+    return dates
+
+
+def lesson_to_json(lesson: Lesson, date: str) -> dict[str, Any]:
+    return {"date": date, **{key: value for key, value in lesson.raw.items() if key not in ("dates", "date")}}
+
+
+def export_lessons(
+    lessons: list[Lesson],
+    shards_dir: Path,
+    columns: list[str],
+    get_row: Callable[[Lesson], list],
+    manifest_info: dict[str, Any],
+) -> int:
+    """Пишет по файлу .txt и .json на каждую дату от первой до последней и manifest.json.
+
+    Возвращает количество выгруженных занятий.
+    """
+    shards_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = shards_dir / "manifest.json"
+
+    try:
+        old_manifest = manifest_path.read_text(encoding="utf-8")
+        old_hashes = json.loads(old_manifest)["dates"]
+    except (OSError, ValueError, KeyError):
+        old_manifest = None
+        old_hashes = {}
+
+    timeline = build_timeline(lessons)
+    # Файлы пишутся и для дней без пар внутри семестра, чтобы виджеты не получали 404
+    all_dates = date_span(min(timeline), max(timeline)) if timeline else []
+
+    hashes = {}
+    lessons_count = 0
+    for shard_date in all_dates:
+        date_lessons = timeline.get(shard_date, [])
+        old = old_hashes.get(shard_date, {})
+        lessons_count += len(date_lessons)
+
+        text = format_data_frame([get_row(lesson) for lesson in date_lessons], columns)
+        json_lessons = [lesson_to_json(lesson, shard_date) for lesson in date_lessons]
+
+        hashes[shard_date] = {
+            "txt": write_shard(shards_dir / (shard_date + ".txt"), text + "\n" if text else "", old.get("txt")),
+            "json": write_shard(
+                shards_dir / (shard_date + ".json"),
+                json.dumps(json_lessons, ensure_ascii=False, indent=1) + "\n",
+                old.get("json"),
+            ),
+        }
+
+    for stale_date in old_hashes.keys() - hashes.keys():
+        for suffix in (".txt", ".json"):
+            (shards_dir / (stale_date + suffix)).unlink(missing_ok=True)
+
+    manifest_text = json.dumps({**manifest_info, "dates": hashes}, ensure_ascii=False, indent=1) + "\n"
+    if manifest_text != old_manifest:
+        write_shard(manifest_path, manifest_text, None)
+
+    return lessons_count
@@ -0,0 +1,112 @@
+import json
+import os
+import time
+from pathlib import Path
+
+METRICS_FILE_ENV = "NPI_SCHEDULE_METRICS"
+FETCH_DURATION_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class FetchMetrics:
+    """Счётчики одного запуска: заполняются ApiEndpoint и CLI."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.durations: list[float] = []
+        self.lessons = 0
+
+
+def render_metrics(state: dict) -> str:
+    lines = []
+
+    def metric(name: str, metric_type: str, help_text: str, samples: list[tuple[str, float]]):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(f"{name}{labels} {value}" for labels, value in samples)
+
+    buckets = [
+        ('{le="%g"}' % bound, count)
+        for bound, count in zip(FETCH_DURATION_BUCKETS, state["duration_buckets"])
+    ]
+    buckets.append(('{le="+Inf"}', state["duration_count"]))
+
+    metric("npi_schedule_fetch_duration_seconds", "histogram", "Время HTTP-запросов к API расписания", [])
+    lines.extend(f"npi_schedule_fetch_duration_seconds_bucket{labels} {value}" for labels, value in buckets)
+    lines.append(f"npi_schedule_fetch_duration_seconds_sum {state['duration_sum']}")
+    lines.append(f"npi_schedule_fetch_duration_seconds_count {state['duration_count']}")
+
+    metric("npi_schedule_fetch_bytes_total", "counter", "Получено байт от API", [("", state["bytes"])])
+    metric("npi_schedule_requests_total", "counter", "Запросы к API, включая отданные из кэша", [("", state["requests"])])
+    metric("npi_schedule_cache_hits_total", "counter", "Запросы, отданные из кэша", [("", state["cache_hits"])])
+    metric(
+        "npi_schedule_cache_hit_ratio", "gauge", "Доля запросов, отданных из кэша",
+        [("", state["cache_hits"] / state["requests"] if state["requests"] else 0)],
+    )
+    metric("npi_schedule_failures_total", "counter", "Неудачные запуски", [("", state["failures"])])
+    metric(
+        "npi_schedule_consecutive_failures", "gauge", "Неудачные запуски подряд",
+        [("", state["consecutive_failures"])],
+    )
+    metric(
+        "npi_schedule_last_run_timestamp_seconds", "gauge", "Время последнего запуска",
+        [("", state["last_run"])],
+    )
+    metric(
+        "npi_schedule_last_success_timestamp_seconds", "gauge", "Время последнего успешного запуска",
+        [("", state["last_success"])],
+    )
+    metric(
+        "npi_schedule_lessons", "gauge", "Количество занятий в последнем выводе",
+        [('{query="%s"}' % query, count) for query, count in sorted(state["lessons"].items())],
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(metrics: FetchMetrics, metrics_file: str, query: str, is_success: bool):
+    # Счётчики копятся между запусками, поэтому рядом хранится их состояние
+    state_path = Path(metrics_file + ".state.json")
+    state = {
+        "requests": 0, "cache_hits": 0, "bytes": 0, "failures": 0,
+        "consecutive_failures": 0, "last_run": 0, "last_success": 0,
+        "duration_buckets": [0] * len(FETCH_DURATION_BUCKETS),
+        "duration_sum": 0, "duration_count": 0, "lessons": {},
+    }
+    try:
+        with open(state_path, encoding="utf-8") as fp:
+            state.update(json.load(fp))
+    except (OSError, ValueError):
+        pass
+
+    now = time.time()
+    state["requests"] += metrics.requests
+    state["cache_hits"] += metrics.cache_hits
+    state["bytes"] += metrics.bytes
+    state["last_run"] = now
+
+    for duration in metrics.durations:
+        state["duration_sum"] += duration
+        state["duration_count"] += 1
+        for index, bound in enumerate(FETCH_DURATION_BUCKETS):
+            if duration <= bound:
+                state["duration_buckets"][index] += 1
+
+    if is_success:
+        state["consecutive_failures"] = 0
+        state["last_success"] = now
+        state["lessons"][query] = metrics.lessons
+    else:
+        state["failures"] += 1
+        state["consecutive_failures"] += 1
+
+    # Запись через временный файл, чтобы node-exporter не прочитал файл наполовину
+    for path, text in (
+        (state_path, json.dumps(state)),
+        (Path(metrics_file), render_metrics(state)),
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Iterable
+
+from .utils import get_time
+
+
+@dataclass(frozen=True, slots=True)
+class Lesson:
+    """Одно занятие из расписания студента, лектора или аудитории."""
+
+    dates: tuple[str, ...]
+    discipline: str
+    type: str
+    pair: int | None = None
+    start: str | None = None
+    end: str | None = None
+    auditorium: str | None = None
+    lecturer: str | None = None
+    groups: tuple[str, ...] = ()
+    # Исходная запись API (для JSON-выгрузки), в сравнении и repr не участвует
+    raw: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @property
+    def title(self) -> str:
+        return self.type + "-" + self.discipline
+
+    @property
+    def period(self) -> str | None:
+        if self.start and self.end:
+            return self.start + "-" + self.end
+
+        return self.start
+
+    @property
+    def start_minutes(self) -> int:
+        if not self.start:
+            return 0
+
+        hours, minutes = self.start.split(":")
+        return int(hours) * 60 + int(minutes)
+
+    @classmethod
+    def from_json(cls, info: dict[str, Any]) -> "Lesson":
+        pair = info.get("class")
+
+        return cls(
+            dates=json_dates(info),
+            discipline=info.get("discipline", ""),
+            type=info.get("type", ""),
+            pair=pair,
+            start=info.get("start") or get_time(pair),
+            end=info.get("end"),
+            auditorium=info.get("auditorium"),
+            lecturer=info.get("lecturer"),
+            groups=tuple(info.get("groups") or ()),
+            raw=info,
+        )
+
+
+Timeline = dict[str, list[Lesson]]
+
+
+def json_dates(info: dict[str, Any]) -> tuple[str, ...]:
+    # У обычных занятий список "dates", у зачётной недели одна "date"
+    dates = info.get("dates") or info.get("date") or ()
+    if isinstance(dates, str):
+        return (dates,)
+
+    return tuple(dates)
+
+
+def lessons_from_response(data: dict[str, Any] | list[dict[str, Any]]) -> list[Lesson]:
+    # Обычное расписание приходит как {"classes": [...]}, зачётная неделя — списком
+    classes = data.get("classes", []) if isinstance(data, dict) else data
+    return [Lesson.from_json(info) for info in classes]
+
+
+def expand_date_range(value: str) -> list[str]:
+    start, end = (date.fromisoformat(item) for item in value.split(".."))
+    return [(start + timedelta(days=day)).isoformat() for day in range((end - start).days + 1)]
+
+
+def parse_dates(dates: str | Iterable[str] | None) -> set[str] | None:
+    """Дата, список дат через запятую или диапазон `Start..End`."""
+    if dates is None:
+        return None
+
+    if isinstance(dates, str):
+        dates = dates.split(",")
+
+    date_set = set()
+    for item in dates:
+        if ".." in item:
+            date_set.update(expand_date_range(item))
+        else:
+            date_set.add(item)
+
+    return date_set
+
+
+def json_on_dates(dates: str | Iterable[str] | None) -> Callable[[dict[str, Any]], bool]:
+    """Фильтр записей API по датам, чтобы отбрасывать их ещё до создания `Lesson`."""
+    date_set = parse_dates(dates)
+
+    def keep(info: dict[str, Any]) -> bool:
+        return date_set is None or not date_set.isdisjoint(json_dates(info))
+
+    return keep
+
+
+def filter_lessons(
+    lessons: Iterable[Lesson], dates: str | Iterable[str] | None = None
+) -> list[Lesson]:
+    date_set = parse_dates(dates)
+    if date_set is None:
+        return list(lessons)
+
+    return [lesson for lesson in lessons if date_set.intersection(lesson.dates)]
+
+
+def build_timeline(
+    lessons: Iterable[Lesson], dates: str | Iterable[str] | None = None
+) -> Timeline:
+    """Индекс дата -> занятия, отсортированный по датам и времени начала.
+
+    Занятие на несколько дат попадает в каждую из запрошенных.
+    """
+    date_set = parse_dates(dates)
+    timeline: Timeline = {}
+
+    for lesson in lessons:
+        for lesson_date in lesson.dates:
+            if date_set is None or lesson_date in date_set:
+                timeline.setdefault(lesson_date, []).append(lesson)
+
+    return {
+        lesson_date: sorted(timeline[lesson_date], key=lambda lesson: lesson.start_minutes)
+        for lesson_date in sorted(timeline)
+    }
@@ -0,0 +1,131 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas
+
+from .core import Printer
+from .models import Lesson, Timeline
+from .utils import print_data_frame
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Оформление вывода, в котором расходились main/npi-api.py и oops/main.py."""
+
+    date_header: str
+    date_footer: str
+    corpus_header: str
+    show_title: bool
+    max_col_width: int | None
+    # oops/main.py выставлял ширину колонки и глобально в pandas
+    global_max_col_width: bool
+
+
+MAIN_LAYOUT = Layout(
+    date_header="Расписание на {}",
+    date_footer="\n",
+    corpus_header="Корпус: {}",
+    show_title=True,
+    max_col_width=None,
+    global_max_col_width=False,
+)
+OOPS_LAYOUT = Layout(
+    date_header="\nРасписание на {}",
+    date_footer="",
+    corpus_header="\nКорпус: {}",
+    show_title=False,
+    max_col_width=500,
+    global_max_col_width=True,
+)
+
+
+class SchedulePrinter(Printer):
+    def __init__(self, layout: Layout = MAIN_LAYOUT) -> None:
+        self.layout = layout
+
+    def __call__(
+        self,
+        timeline: Timeline,
+        columns: list[str],
+        get_row: Callable[[Lesson], list],
+        with_headers: bool = False,
+        title: str | None = None,
+    ) -> Any:
+        if title is not None and self.layout.show_title:
+            print(title)
+
+        for date, lessons in timeline.items():
+            if with_headers:
+                print(self.layout.date_header.format(date))
+
+            print_data_frame([get_row(lesson) for lesson in lessons], columns)
+
+            if with_headers:
+                print(self.layout.date_footer, end="")
+
+
+class ListPrinter(Printer):
+    def __call__(self, data: Any) -> Any:
+        for item in data:
+            print(item)
+
+
+# FIXME: Сделать более универсальный класс Printer: DictPrinter?
+class AuditoriumsPrinter(Printer):
+    def __init__(self, layout: Layout = MAIN_LAYOUT) -> None:
+        self.layout = layout
+
+    def __call__(self, data: Any) -> Any:
+        for corpus, auditoriums in data.items():
+            print(self.layout.corpus_header.format(corpus))
+            for auditorium, room_type in auditoriums:
+                print(auditorium, room_type)
+
+
+class AnalyticsPrinter(Printer):
+    TITLES = {
+        "auditoriums": "Загрузка аудиторий",
+        "peak_slots": "Пиковые пары",
+        "lecturers": "Нагрузка преподавателей по неделям",
+        "workload_histogram": "Распределение недельной нагрузки",
+    }
+
+    def _print_table(self, report: dict[str, pandas.DataFrame], output: str | None):
+        for name, data_frame in report.items():
+            print("\n" + self.TITLES[name])
+            print_data_frame(data_frame.values.tolist(), list(data_frame.columns))
+
+    def _print_csv(self, report: dict[str, pandas.DataFrame], output: str | None):
+        if output is None:
+            for name, data_frame in report.items():
+                print("\n" + self.TITLES[name])
+                print(data_frame.to_csv(index=False), end="")
+            return
+
+        directory = Path(output)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, data_frame in report.items():
+            data_frame.to_csv(directory / (name + ".csv"), index=False)
+
+    def _print_json(self, report: dict[str, pandas.DataFrame], output: str | None):
+        data = {
+            name: json.loads(data_frame.to_json(orient="records", force_ascii=False))
+            for name, data_frame in report.items()
+        }
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+
+        if output is None:
+            print(text)
+        else:
+            Path(output).write_text(text + "\n", encoding="utf-8")
+
+    def __call__(self, data: Any, output_format: str = "table", output: str | None = None) -> Any:
+        print_function = {
+            "table": self._print_table,
+            "csv": self._print_csv,
+            "json": self._print_json,
+        }[output_format]
+
+        print_function(data, output)
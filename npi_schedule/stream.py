@@ -0,0 +1,153 @@
+"""Потоковый разбор JSON-ответов расписания.
+
+Из ответа `{"classes": [...], ...}` (или списка занятий, как у зачётной
+недели) занятия декодируются по одному по мере чтения, и сразу
+отбрасываются те, что не прошли фильтр. В памяти держится только
+непрочитанный хвост буфера и оставленные занятия.
+"""
+import codecs
+import json
+from typing import Any, Callable, Iterable, Iterator
+
+CHUNK_SIZE = 64 * 1024
+ITEMS_KEY = "classes"
+WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.chunks = iter(chunks)
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self) -> bool:
+        if self.eof:
+            return False
+
+        # Прочитанное начало буфера больше не нужно
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+
+        for chunk in self.chunks:
+            text = self.text_decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+
+        self.buffer += self.text_decoder.decode(b"", final=True)
+        self.eof = True
+        return True
+
+    def peek(self) -> str:
+        """Первый непробельный символ (не сдвигая позицию), "" — конец данных."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            if not self.read_more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError("Ожидалось одно из " + repr(chars), self.buffer, self.pos)
+
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.read_more():
+                    continue
+                raise
+
+            # Число в самом конце буфера может продолжаться в следующем куске
+            if end == len(self.buffer) and not self.eof:
+                self.read_more()
+                continue
+
+            self.pos = end
+            return value
+
+
+def _iter_array(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+
+    while True:
+        yield reader.value()
+
+        if reader.expect(",]") == "]":
+            return
+
+
+def _iter_items(reader: _Reader, fields: dict[str, Any] | None, key: str) -> Iterator[Any]:
+    if reader.peek() == "[":
+        yield from _iter_array(reader)
+    else:
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                name = reader.value()
+                reader.expect(":")
+
+                if name == key and reader.peek() == "[":
+                    yield from _iter_array(reader)
+                elif fields is not None:
+                    fields[name] = reader.value()
+                else:
+                    reader.value()
+
+                if reader.expect(",}") == "}":
+                    break
+
+    if reader.peek():
+        raise json.JSONDecodeError("Лишние данные после JSON", reader.buffer, reader.pos)
+
+
+def iter_items(
+    chunks: Iterable[bytes], fields: dict[str, Any] | None = None, key: str = ITEMS_KEY
+) -> Iterator[Any]:
+    """Элементы списка `key` из JSON-объекта (или самого списка) по мере чтения `chunks`.
+
+    Остальные поля объекта складываются в `fields`.
+    """
+    return _iter_items(_Reader(chunks), fields, key)
+
+
+def load_filtered(
+    chunks: Iterable[bytes], keep: Callable[[Any], bool], key: str = ITEMS_KEY
+) -> dict[str, Any] | list[Any]:
+    """Ответ той же формы, что и `json.loads`, но в `key` только элементы, прошедшие `keep`."""
+    reader = _Reader(chunks)
+    is_list = reader.peek() == "["
+    fields: dict[str, Any] = {}
+    items = [item for item in _iter_items(reader, fields, key) if keep(item)]
+
+    return items if is_list else {**fields, key: items}
+
+
+def filter_response(
+    data: dict[str, Any] | list[Any], keep: Callable[[Any], bool], key: str = ITEMS_KEY
+) -> dict[str, Any] | list[Any]:
+    """То же, что `load_filtered`, для уже декодированного ответа (например, из кэша)."""
+    if isinstance(data, list):
+        return [item for item in data if keep(item)]
+
+    return {**data, key: [item for item in data.get(key, []) if keep(item)]}
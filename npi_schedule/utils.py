@@ -0,0 +1,119 @@
+from argparse import SUPPRESS, ArgumentParser, ArgumentTypeError
+from datetime import date, datetime, timedelta
+
+import pandas
+
+# Значение, с которым работал main/npi-api.py
+DEFAULT_PANDAS_MAX_COLWIDTH = 1000
+
+API_URL = "https://schedule.npi-tu.ru/api/"
+SUBCOMMANDS_ALIASES = [("student", "s"), ("lecturers", "l"), ("auditoriums", "a"), ("analytics", "an")]
+NOW_DATE = datetime.now().strftime("%Y-%m-%d")
+TIMES = {1: "9:00", 2: "10:45", 3: "13:15", 4: "15:00", 5: "16:45", 6: "18:30"}
+FACULTIES = {
+    "1": {"code": "ФГГНГД", "name": "Факультет геологии, горного и нефтегазового дела"},
+    "2": {"code": "ФИТУ", "name": "Факультет информационных технологий и управления"},
+    "3": {"code": "ИДО", "name": "Институт дополнительного образования"},
+    "4": {
+        "code": "АСИиГР",
+        "name": "Академия социальных исследований и гуманитарного развития",
+    },
+    "5": {"code": "МФ", "name": "Механический факультет"},
+    "6": {"code": "ЭНФ", "name": "Энергетический факультет"},
+    "7": {"code": "ТФ", "name": "Технологический факультет"},
+    "8": {"code": "СФ", "name": "Строительный факультет"},
+    "9": {"code": "АС", "name": "Аспирантура"},
+    "D": {"code": "ИМО", "name": "Институт международного образования"},
+    "A": {"code": "ИФИО", "name": "Институт фундаментального инженерного образования"},
+    "C": {"code": "ИБ", "name": "Информационная безопасность"},
+    "F": {"code": "НПК", "name": "Новочеркасский политехнический колледж"},
+    "B": {"code": "ФИОП", "name": "Факультет инноватики и организации производства"},
+}
+
+max_column_width: int | None = None
+# Ширина колонок без -m (None — без ограничения). Задаётся через option_context, а не
+# pandas.options: пакет импортируют и как библиотеку
+default_max_column_width: int | None = DEFAULT_PANDAS_MAX_COLWIDTH
+
+
+def get_time(lesson_class: int) -> str | None:
+    return TIMES.get(lesson_class)
+
+
+def get_tomorrow_date() -> str:
+    return (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def split_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def iso_date(value: str) -> str:
+    """Тип аргумента argparse: дата Year-month-day."""
+    try:
+        return date.fromisoformat(value.strip()).isoformat()
+    except ValueError:
+        raise ArgumentTypeError("некорректная дата «%s», нужна Year-month-day" % value) from None
+
+
+def date_list(value: str) -> str:
+    """Тип аргумента argparse: дата, список дат через запятую или диапазон Start..End."""
+    items = []
+    for item in value.split(","):
+        if ".." not in item:
+            items.append(iso_date(item))
+            continue
+
+        start, end = (iso_date(part) for part in item.split("..", 1))
+        if start > end:
+            raise ArgumentTypeError("начало диапазона %s позже конца %s" % (start, end))
+
+        items.append(start + ".." + end)
+
+    return ",".join(items)
+
+
+def add_argument_date(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "-d",
+        "--date",
+        type=date_list,
+        help="Дата (Year-month-day), список дат через запятую или диапазон Start..End, по умолчанию сегодняшняя: "
+        + NOW_DATE,
+        default=NOW_DATE,
+    )
+
+
+def add_argument_max_col_width(parser: ArgumentParser, default=SUPPRESS) -> None:
+    # У подкоманд значение по умолчанию не задаётся, чтобы не затирать `-m` перед подкомандой
+    parser.add_argument(
+        "-m", "--max-col-width",
+        help="Максимальная ширина колонки при выводе",
+        type=int,
+        default=default,
+    )
+
+
+def format_data_frame(data: list, columns: list) -> str:
+    data_frame = pandas.DataFrame(data, columns=columns)
+
+    if data_frame.empty:
+        return ""
+
+    with pandas.option_context("display.max_colwidth", default_max_column_width):
+        return data_frame.to_string(index=False, max_colwidth=max_column_width)
+
+
+def print_data_frame(data: list, columns: list):
+    data_frame_string = format_data_frame(data, columns)
+
+    if data_frame_string:
+        print(data_frame_string)
+
+
+def set_global_max_col_width(colwidth: int | None, global_width: bool = False):
+    global max_column_width, default_max_column_width
+
+    max_column_width = colwidth
+    # oops/main.py выставлял ширину и как ширину pandas по умолчанию
+    default_max_column_width = colwidth if global_width else DEFAULT_PANDAS_MAX_COLWIDTH
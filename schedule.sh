@@ -5,6 +5,10 @@
 SCHEDULE_CMD="$HOME/.local/bin/_schedule_opts"
 SCHEDULE_DIR="$HOME/.config/schedule"
 MAX_COL_WIDTH=200
+# Метрики обновления в формате Prometheus. Для node-exporter укажите путь
+# в каталоге textfile-коллектора (Environment=NPI_SCHEDULE_METRICS=... в schedule.service),
+# по умолчанию файл отдаётся schedule-httpd по адресу /metrics
+export NPI_SCHEDULE_METRICS="${NPI_SCHEDULE_METRICS:-$SCHEDULE_DIR/npi_schedule.prom}"
 
 if [ ! -f "$SCHEDULE_CMD" ]; then
     echo "Ошибка: $SCHEDULE_CMD не найден. Запустите 'make setup'." >&2
@@ -20,13 +24,29 @@ while ! ping -q -c 1 npi-tu.ru > /dev/null 2>&1; do
 done
 echo "Соединение установлено."
 
+# Копирует файл даты в today/tomorrow, только если содержимое изменилось
+update_day_file() {
+    local shard="$SCHEDULE_DIR/days/$1.txt"
+    local target="$SCHEDULE_DIR/$2"
+
+    if [ ! -f "$shard" ]; then
+        shard=/dev/null
+    fi
+
+    if ! cmp -s "$shard" "$target"; then
+        cp "$shard" "$target"
+    fi
+}
+
 # Получение расписания (с повторными попытками)
 echo "Получение расписания..."
 while true; do
-    TODAY=$(date +%Y-%m-%d)
-
-    if $SCHEDULE_CMD -m "$MAX_COL_WIDTH" > "$SCHEDULE_DIR/today" 2>/dev/null; then
-        $SCHEDULE_CMD -m "$MAX_COL_WIDTH" -t > "$SCHEDULE_DIR/tomorrow" 2>/dev/null
+    # Файл на каждую дату семестра: $SCHEDULE_DIR/days/ГГГГ-ММ-ДД.{txt,json}
+    if $SCHEDULE_CMD -m "$MAX_COL_WIDTH" -e "$SCHEDULE_DIR" 2>/dev/null; then
+        update_day_file "$(date +%Y-%m-%d)" today
+        update_day_file "$(date -d tomorrow +%Y-%m-%d)" tomorrow
+        # Будим запросы виджета, ждущие изменений (schedule-httpd сам файлы не опрашивает)
+        systemctl --user kill -s USR1 schedule-httpd.service 2>/dev/null || true
         echo "Расписание сохранено."
         break
     else
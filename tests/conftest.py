@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+from urllib.parse import unquote
+
+import pytest
+import requests
+
+from npi_schedule.metrics import METRICS_FILE_ENV
+from npi_schedule.utils import API_URL
+
+RESPONSES = json.loads(
+    (Path(__file__).parent / "fixtures" / "responses.json").read_text(encoding="utf-8")
+)
+
+
+class FakeResponse:
+    def __init__(self, data) -> None:
+        self.status_code = 404 if data is None else 200
+        self._data = data
+        self.content = json.dumps(data, ensure_ascii=False).encode()
+
+    def json(self):
+        return self._data
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(self.status_code, response=self)
+
+
+@pytest.fixture(autouse=True)
+def recorded_api(monkeypatch):
+    """Ответы API из fixtures/responses.json; возвращает список запрошенных путей."""
+    requested = []
+
+    def get(session, url, *args, **kwargs):
+        path = unquote(url[len(API_URL):])
+        requested.append(path)
+        return FakeResponse(RESPONSES.get(path))
+
+    monkeypatch.setattr(requests.Session, "get", get)
+    monkeypatch.delenv(METRICS_FILE_ENV, raising=False)
+
+    return requested
@@ -0,0 +1,158 @@
+"""Аналитика на записанных ответах: аудитория 310ГЛ и лектор Иванов И И.
+
+2025-09-01 — понедельник. Период 2025-09-01..2025-09-08 — 7 рабочих дней
+(Пн-Сб) и 8-е число уже на второй неделе.
+"""
+import numpy as np
+import pytest
+
+from npi_schedule import Client
+from npi_schedule.analytics import (PAIRS, build_report, date_range, lecturer_workload,
+                                    lessons_bounds, occupancy_cube, occupancy_matrix,
+                                    peak_slots, room_utilisation, workload_histogram)
+from npi_schedule.cli import Main
+from npi_schedule.models import Lesson
+
+START, END = "2025-09-01", "2025-09-08"
+
+
+@pytest.fixture
+def auditorium():
+    # 01.09 1-я пара, 08.09 1-я пара, 02.09 2-я и 6-я пары
+    return Client(use_cache=False).auditorium_schedule("310ГЛ")
+
+
+@pytest.fixture
+def lecturer():
+    # 01.09 1-я и 5-я пары, 08.09 1-я пара, 02.09 2-я пара
+    return Client(use_cache=False).lecturer_schedule("Иванов И И")
+
+
+def cells(matrix: np.ndarray) -> list[tuple[int, int]]:
+    return [tuple(map(int, cell)) for cell in np.argwhere(matrix)]
+
+
+def test_occupancy_matrix(auditorium):
+    dates = date_range(START, END)
+    matrix = occupancy_matrix(auditorium, dates)
+
+    assert matrix.shape == (8, PAIRS)
+    assert cells(matrix) == [(0, 0), (1, 1), (1, 5), (7, 0)]
+
+
+def test_occupancy_matrix_skips_dates_outside_period_and_unknown_pairs():
+    lessons = [
+        Lesson(("2025-08-31", "2025-09-03", "2025-09-04", "2025-09-20"), "Математика", "лек", pair=3),
+        Lesson(("2025-09-02",), "Физика", "пр", pair=None),
+        Lesson(("2025-09-02",), "Физика", "пр", pair=9),
+    ]
+
+    matrix = occupancy_matrix(lessons, date_range("2025-09-01", "2025-09-05"))
+
+    assert cells(matrix) == [(2, 2), (3, 2)]
+
+
+def test_room_utilisation(auditorium):
+    dates = date_range(START, END)
+    cube = occupancy_cube({"310ГЛ": auditorium, "215ГЛ": []}, dates)
+
+    table = room_utilisation(["310ГЛ", "215ГЛ"], cube, dates)
+
+    # 4 занятых пары из 7 рабочих дней x 6 пар
+    assert table.to_dict("list") == {
+        "Аудитория": ["310ГЛ", "215ГЛ"],
+        "Занято пар": [4, 0],
+        "Всего пар": [42, 42],
+        "Загрузка, %": [9.5, 0.0],
+    }
+
+
+def test_peak_slots(auditorium):
+    dates = date_range(START, END)
+    cube = occupancy_cube({"310ГЛ": auditorium, "215ГЛ": []}, dates)
+
+    table = peak_slots(cube, dates)
+
+    # Два понедельника x две аудитории: 1-я пара занята 2 раза из 4
+    assert table.to_dict("list") == {
+        "День": ["Пн", "Вт", "Вт"],
+        "Пара": [1, 2, 6],
+        "Начало": ["9:00", "10:45", "18:30"],
+        "Загрузка, %": [50.0, 50.0, 50.0],
+    }
+    assert len(peak_slots(cube, dates, top=2)) == 2
+
+
+def test_lecturer_workload(lecturer):
+    dates = date_range(START, END)
+    cube = occupancy_cube({"Иванов И И": lecturer, "Петров П П": []}, dates)
+
+    table = lecturer_workload(["Иванов И И", "Петров П П"], cube, dates)
+
+    assert table.to_dict("list") == {
+        "Преподаватель": ["Иванов И И", "Петров П П"],
+        "2025-09-01": [3, 0],
+        "2025-09-08": [1, 0],
+        "Всего": [4, 0],
+        "Макс. в неделю": [3, 0],
+    }
+
+
+def test_workload_histogram(lecturer):
+    dates = date_range(START, END)
+    cube = occupancy_cube({"Иванов И И": lecturer, "Петров П П": []}, dates)
+
+    table = workload_histogram(cube, dates)
+
+    # Недели (преподаватель, неделя): 3, 1, 0, 0
+    assert table.to_dict("list") == {"Пар в неделю": [0, 1, 2, 3], "Недель": [2, 1, 0, 1]}
+
+
+def test_start_after_end(auditorium, lecturer):
+    report = build_report({"310ГЛ": auditorium}, {"Иванов И И": lecturer}, END, START)
+
+    assert report["auditoriums"].to_dict("list") == {
+        "Аудитория": ["310ГЛ"],
+        "Занято пар": [0],
+        "Всего пар": [0],
+        "Загрузка, %": [0.0],
+    }
+    assert report["peak_slots"].empty
+    assert report["lecturers"].to_dict("list") == {
+        "Преподаватель": ["Иванов И И"],
+        "Всего": [0],
+        "Макс. в неделю": [0],
+    }
+    assert report["workload_histogram"].to_dict("list") == {"Пар в неделю": [0], "Недель": [0]}
+
+
+def test_empty_schedules():
+    assert lessons_bounds([[], []]) is None
+    assert build_report({}, {}, START, END) == {}
+
+    report = build_report({"310ГЛ": []}, {"Иванов И И": []}, START, END)
+
+    assert report["auditoriums"]["Загрузка, %"].tolist() == [0.0]
+    assert report["peak_slots"].empty
+    assert report["lecturers"]["Всего"].tolist() == [0]
+    assert report["workload_histogram"].to_dict("list") == {"Пар в неделю": [0], "Недель": [2]}
+
+
+def test_lessons_bounds(auditorium, lecturer):
+    assert lessons_bounds([auditorium, lecturer]) == ("2025-09-01", "2025-09-08")
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["--start", "bad"], "некорректная дата «bad»"),
+        (["--end", "2025-13-01"], "некорректная дата «2025-13-01»"),
+        (["--start", "2025-09-08", "--end", "2025-09-01"], "начало периода 2025-09-08 позже конца 2025-09-01"),
+    ],
+)
+def test_cli_rejects_bad_period(argv, message, capsys):
+    with pytest.raises(SystemExit) as error:
+        Main().start(["--no-cache", "an", "-a", "310ГЛ", *argv])
+
+    assert error.value.code == 2
+    assert message in capsys.readouterr().err
@@ -0,0 +1,56 @@
+import asyncio
+import json
+import threading
+
+from npi_schedule import AsyncClient, Client, ResponseCache
+from npi_schedule import cache as cache_module
+
+
+def test_async_client_keeps_passed_client_open(monkeypatch):
+    closed = []
+    monkeypatch.setattr(Client, "close", lambda self: closed.append(self))
+    client = Client(use_cache=False)
+
+    async def load(async_client):
+        async with async_client:
+            return await async_client.lecturer_schedule("Иванов И И", dates="2025-09-01")
+
+    assert asyncio.run(load(AsyncClient(client))) == client.lecturer_schedule("Иванов И И", dates="2025-09-01")
+    assert closed == []
+
+    own = AsyncClient(use_cache=False)
+    asyncio.run(load(own))
+    assert closed == [own.client]
+
+
+def test_lessons_are_hashable():
+    lessons = Client(use_cache=False).lecturer_schedule("Иванов И И")
+
+    assert lessons[1].groups == ("ИСПа", "ИСПб")
+    assert len(set(lessons + lessons)) == len(lessons)
+
+
+def test_concurrent_cache_writes_use_own_temp_files(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path)
+    both_writing = threading.Barrier(2, timeout=5)
+    temp_files = []
+    dump = json.dump
+
+    def slow_dump(data, fp, **kwargs):
+        temp_files.append(fp.name)
+        dump(data, fp, **kwargs)
+        fp.flush()
+        both_writing.wait()
+
+    monkeypatch.setattr(cache_module.json, "dump", slow_dump)
+
+    # Как analytics -a 310ГЛ,310ГЛ: один URL из двух потоков пула
+    threads = [threading.Thread(target=cache.set, args=("url", [index])) for index in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(temp_files)) == 2
+    assert cache.get("url") in ([0], [1])
+    assert [path.name for path in tmp_path.iterdir()] == [cache._path("url").name]
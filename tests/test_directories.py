@@ -0,0 +1,171 @@
+import os
+import threading
+
+import pytest
+import requests
+
+from npi_schedule import Client, ResponseCache
+from npi_schedule.cli import Main
+from npi_schedule.directories import UnknownNameError
+
+GROUPS_PATH = "v2/faculties/F/years/3/groups"
+SCHEDULE_PATH = GROUPS_PATH + "/ИСПа/schedule"
+
+
+@pytest.fixture
+def client(tmp_path):
+    return Client(cache=ResponseCache(tmp_path))
+
+
+def run(client, argv):
+    Main(client=client).start(argv)
+    client.directories.wait()
+
+
+def test_unknown_group_fails_before_schedule_request(client, recorded_api, capsys):
+    with pytest.raises(SystemExit) as error:
+        run(client, ["s", "-g", "ИСП", "-f", "F", "-c", "3"])
+
+    assert error.value.code == 2
+    assert "Группа «ИСП» не найдена на факультете F, курс 3. Возможно: ИСПа, ИСПб" in capsys.readouterr().err
+    assert recorded_api == [GROUPS_PATH]
+
+
+def test_group_is_corrected_and_directory_is_reused(client, recorded_api, capsys):
+    Main().start(["--no-cache", "s", "-g", "ИСПа", "-f", "F", "-c", "3", "-d", "2025-09-01"])
+    expected = capsys.readouterr().out
+
+    run(client, ["s", "-g", "испа", "-f", "F", "-c", "3", "-d", "2025-09-01"])
+    run(client, ["s", "-g", "ИСПа ", "-f", "F", "-c", "3", "-d", "2025-09-01"])
+
+    captured = capsys.readouterr()
+    assert captured.out == expected * 2
+    assert "«испа» исправлено на «ИСПа»" in captured.err
+    assert recorded_api.count(GROUPS_PATH) == 1
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["l", "schedule", "иванов и.и."], None),
+        (["l", "schedule", "Иваноф И И"], "Лектор «Иваноф И И» не найден. Возможно: Иванов И И"),
+        (["a", "schedule", "310гл"], None),
+        (["an", "-a", "312ГЛ"], "Аудитория «312ГЛ» не найдена. Возможно: 310ГЛ, 311ГЛ"),
+    ],
+)
+def test_lecturers_and_auditoriums(client, argv, message, capsys):
+    if message is None:
+        run(client, argv + ["-d", "2025-09-01"])
+        assert "исправлено" in capsys.readouterr().err
+        return
+
+    with pytest.raises(SystemExit):
+        run(client, argv)
+
+    assert message in capsys.readouterr().err
+
+
+def test_name_missing_from_letter_directory_is_searched_in_full(client, recorded_api):
+    # Справочники на «И» и «3» (обрезанные поиском) этих имён не содержат
+    assert client.directories.match_lecturer("Ивашов П.П.") == "Ивашов П П"
+    assert client.directories.match_auditorium(" 390ГЛ") == "390ГЛ"
+
+    assert recorded_api == ["v1/lecturers/И", "v1/lecturers/Ивашов П П", "v1/auditoriums/3", "v1/auditoriums/390ГЛ"]
+
+
+def test_name_missing_from_full_search_is_rejected(client, recorded_api):
+    with pytest.raises(UnknownNameError) as error:
+        client.directories.match_lecturer("Иваноф И.И.")
+
+    assert error.value.suggestions == ["Иванов И И", "Иванова А А"]
+    assert recorded_api == ["v1/lecturers/И", "v1/lecturers/Иваноф И И"]
+
+
+def test_failed_full_search_skips_validation(client, monkeypatch):
+    client.directories.lecturers("Иванов И И")
+
+    def get(session, url, *args, **kwargs):
+        raise requests.ConnectionError(url)
+
+    monkeypatch.setattr(requests.Session, "get", get)
+
+    assert client.directories.match_lecturer("Иваноф И И") == "Иваноф И И"
+
+
+def test_name_with_empty_letter_directory_is_rejected(client, recorded_api, capsys):
+    # Поиск по «9» отвечает 404 — справочник пуст, а не недоступен
+    with pytest.raises(SystemExit) as error:
+        run(client, ["a", "schedule", "999"])
+
+    assert error.value.code == 2
+    assert "Аудитория «999» не найдена" in capsys.readouterr().err
+    assert recorded_api == ["v1/auditoriums/9", "v1/auditoriums/999"]
+
+
+def test_api_error_is_reported_without_traceback(client, capsys):
+    with pytest.raises(SystemExit) as error:
+        run(client, ["--no-validate", "a", "schedule", "999"])
+
+    assert error.value.code == 1
+    assert capsys.readouterr().err.startswith("npi-schedule: ошибка API: 404")
+
+
+def test_requests_have_timeout(client, monkeypatch):
+    timeouts = []
+    get = requests.Session.get
+
+    def get_with_timeout(session, url, *args, **kwargs):
+        timeouts.append(kwargs.get("timeout"))
+        return get(session, url, *args, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "get", get_with_timeout)
+
+    client.directories.lecturers("Иванов И И")
+    Client(use_cache=False, stream=True, timeout=5).lecturer_schedule("Иванов И И", dates="2025-09-01")
+
+    assert timeouts == [30, 5]
+
+
+def test_missing_directory_skips_validation(client):
+    assert client.directories.match_group("ИСП", "F", 2) == "ИСП"
+
+
+def test_stale_directory_is_refreshed_in_background(client, recorded_api):
+    directories = client.directories
+    url = client.student_groups_api.format_url(facult="F", course=3)
+    directories.cache.set(url, ["ИСПа"])
+    stale = directories.cache._path(url).stat().st_mtime - directories.refresh_after - 1
+    os.utime(directories.cache._path(url), (stale, stale))
+
+    assert directories.groups("F", 3) == ["ИСПа"]
+    directories.wait()
+
+    assert recorded_api == [GROUPS_PATH]
+    assert directories.groups("F", 3) == ["ИСПа", "ИСПб", "ТМа"]
+
+
+def test_one_background_refresh_per_directory(client, recorded_api, monkeypatch):
+    directories = client.directories
+    url = client.lecturers_search_api.format_url("И")
+    directories.cache.set(url, ["Иванов И И"])
+    stale = directories.cache._path(url).stat().st_mtime - directories.refresh_after - 1
+    os.utime(directories.cache._path(url), (stale, stale))
+
+    release = threading.Event()
+    get = requests.Session.get
+
+    def slow_get(session, url, *args, **kwargs):
+        release.wait(5)
+        return get(session, url, *args, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "get", slow_get)
+
+    # Как analytics -l с несколькими лекторами на одну букву
+    for lecturer in ["Иванов И И", "Иванова А А", "Ивлев К К"]:
+        directories.lecturers(lecturer)
+    release.set()
+    directories.wait()
+
+    assert recorded_api == ["v1/lecturers/И"]
+    assert directories._refreshing == {}
+    assert directories.lecturers("Иванов И И") == ["Иванов И И", "Иванова А А", "Ивлев К К"]
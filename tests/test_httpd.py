@@ -0,0 +1,219 @@
+"""scripts/schedule-httpd на настоящем ThreadingHTTPServer (порт 0)."""
+import http.client
+import os
+import signal
+import threading
+import time
+from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_loader
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "schedule-httpd"
+
+
+def load_httpd():
+    loader = SourceFileLoader("schedule_httpd", str(SCRIPT))
+    module = module_from_spec(spec_from_loader(loader.name, loader))
+    loader.exec_module(module)
+
+    return module
+
+
+httpd = load_httpd()
+
+
+@pytest.fixture
+def schedule_dir(tmp_path):
+    directory = tmp_path / "schedule"
+    directory.mkdir()
+    (directory / "today").write_text("пары сегодня\n", encoding="utf-8")
+    (tmp_path / "secret").write_text("секрет", encoding="utf-8")
+
+    return directory
+
+
+@pytest.fixture
+def server(schedule_dir, monkeypatch):
+    monkeypatch.setattr(httpd, "KEEPALIVE_INTERVAL", 0.2)
+
+    handler = type("Handler", (httpd.ScheduleHandler,), {"files": httpd.ScheduleFiles(schedule_dir)})
+    server = httpd.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path: str, etag: str | None = None, timeout: float = 5) -> http.client.HTTPResponse:
+    connection = http.client.HTTPConnection(*server.server_address, timeout=timeout)
+    connection.request("GET", path, headers={"If-None-Match": etag} if etag else {})
+
+    return connection.getresponse()
+
+
+def replace_later(path: Path, text: str, notify=None, delay: float = 0.2) -> threading.Timer:
+    # Как export_lessons: новый файл подменяет старый через rename, затем schedule.sh будит сервер
+    def replace():
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+        if notify:
+            notify()
+
+    timer = threading.Timer(delay, replace)
+    timer.start()
+
+    return timer
+
+
+def test_etag_and_not_modified(server, schedule_dir):
+    response = get(server, "/today")
+    etag = response.getheader("ETag")
+
+    assert response.status == 200
+    assert response.read().decode() == "пары сегодня\n"
+    assert etag
+
+    response = get(server, "/today", etag)
+    assert response.status == 304
+    assert response.getheader("ETag") == etag
+    assert response.read() == b""
+
+    (schedule_dir / "today").write_text("пар нет\n", encoding="utf-8")
+
+    response = get(server, "/today", etag)
+    assert response.status == 200
+    assert response.read().decode() == "пар нет\n"
+    assert response.getheader("ETag") != etag
+
+
+def test_long_poll_wakes_up_on_notify(server, schedule_dir):
+    etag = get(server, "/today").getheader("ETag")
+    replace_later(schedule_dir / "today", "пары перенесли\n", server.RequestHandlerClass.files.notify)
+
+    started = time.monotonic()
+    response = get(server, "/today?wait=5", etag)
+
+    assert response.status == 200
+    assert response.read().decode() == "пары перенесли\n"
+    assert time.monotonic() - started < 2
+
+
+def test_long_poll_wakes_up_on_sigusr1(server, schedule_dir):
+    previous = signal.getsignal(signal.SIGUSR1)
+    httpd.notify_on_signal(server.RequestHandlerClass.files)
+    try:
+        etag = get(server, "/today").getheader("ETag")
+        replace_later(schedule_dir / "today", "пары перенесли\n", lambda: os.kill(os.getpid(), signal.SIGUSR1))
+
+        started = time.monotonic()
+        response = get(server, "/today?wait=5", etag)
+
+        assert response.status == 200
+        assert time.monotonic() - started < 2
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+
+def test_long_poll_does_not_poll_files(server, schedule_dir):
+    # Без уведомления изменение видно только по истечении wait
+    etag = get(server, "/today").getheader("ETag")
+    replace_later(schedule_dir / "today", "пары перенесли\n", delay=0.1)
+
+    started = time.monotonic()
+    response = get(server, "/today?wait=0.6", etag)
+
+    assert response.status == 200
+    assert response.read().decode() == "пары перенесли\n"
+    assert time.monotonic() - started >= 0.6
+
+
+def test_long_poll_times_out_with_not_modified(server):
+    etag = get(server, "/today").getheader("ETag")
+
+    started = time.monotonic()
+    response = get(server, "/today?wait=0.3", etag)
+
+    assert response.status == 304
+    assert 0.3 <= time.monotonic() - started < 2
+
+
+def test_long_poll_waits_for_missing_file(server, schedule_dir):
+    (schedule_dir / "days").mkdir()
+    replace_later(
+        schedule_dir / "days" / "2026-09-01.txt", "первое сентября\n", server.RequestHandlerClass.files.notify
+    )
+
+    response = get(server, "/days/2026-09-01.txt?wait=5")
+
+    assert response.status == 200
+    assert response.read().decode() == "первое сентября\n"
+
+
+def test_long_poll_on_missing_file_times_out_with_not_found(server):
+    started = time.monotonic()
+    response = get(server, "/days/2026-09-01.txt?wait=0.3")
+
+    assert response.status == 404
+    assert 0.3 <= time.monotonic() - started < 2
+
+
+@pytest.mark.parametrize("wait", ["nan", "inf", "-1", "abc"])
+def test_bad_wait_is_rejected(server, wait):
+    etag = get(server, "/today").getheader("ETag")
+
+    response = get(server, "/today?wait=" + wait, etag, timeout=2)
+
+    assert response.status == 400
+
+
+def test_wait_is_clamped(monkeypatch, server):
+    monkeypatch.setattr(httpd, "MAX_WAIT", 0.2)
+    etag = get(server, "/today").getheader("ETag")
+
+    started = time.monotonic()
+    response = get(server, "/today?wait=1e9", etag)
+
+    assert response.status == 304
+    assert time.monotonic() - started < 2
+
+
+@pytest.mark.parametrize(
+    "path", ["/../secret", "/%2e%2e/secret", "/schedule/../../secret", "/../secret?wait=0", "/missing"]
+)
+def test_path_traversal_and_missing_files(server, path):
+    assert get(server, path).status == 404
+
+
+def read_event(response: http.client.HTTPResponse) -> list[str]:
+    lines = []
+    while (line := response.readline().decode()) != "\n":
+        lines.append(line.rstrip("\n"))
+
+    return lines
+
+
+def test_events(server, schedule_dir):
+    response = get(server, "/events?files=today,../secret,tomorrow")
+    assert response.status == 200
+    assert response.getheader("Content-Type").startswith("text/event-stream")
+
+    event = read_event(response)
+    assert event[0] == "event: today"
+    assert event[2:] == ["data: пары сегодня"]
+
+    # Без изменений — только keepalive
+    assert read_event(response) == [": keepalive"]
+
+    (schedule_dir / "tomorrow").write_text("первая пара\nвторая пара\n", encoding="utf-8")
+    server.RequestHandlerClass.files.notify()
+
+    event = read_event(response)
+    assert event[0] == "event: tomorrow"
+    assert event[2:] == ["data: первая пара", "data: вторая пара"]
+    response.close()
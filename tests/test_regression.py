@@ -0,0 +1,126 @@
+"""Вывод пакета npi_schedule сверяется с выводом прежних main/npi-api.py и oops/main.py.
+
+Эталоны в fixtures/expected сняты со старых скриптов на ответах API из
+fixtures/responses.json.
+"""
+import os
+from pathlib import Path
+
+import pandas
+import pytest
+
+from npi_schedule.cli import Main
+from npi_schedule.printers import MAIN_LAYOUT, OOPS_LAYOUT
+
+FIXTURES = Path(__file__).parent / "fixtures"
+LAYOUTS = {"main": MAIN_LAYOUT, "oops": OOPS_LAYOUT}
+
+GROUP = ["s", "-g", "ИСПа", "-f", "F", "-c", "3"]
+CASES = {
+    "student": GROUP + ["-d", "2025-09-01"],
+    "student_dates": GROUP + ["-d", "2025-09-01,2025-09-02"],
+    "student_empty": GROUP + ["-d", "2025-09-07"],
+    "student_finals": GROUP + ["-0", "-d", "2025-12-25"],
+    "student_finals_dates": GROUP + ["-0", "-d", "2025-12-25,2025-12-27"],
+    "lecturers_search": ["l", "search", "Ив"],
+    "lecturer_schedule": ["l", "schedule", "Иванов И И", "-d", "2025-09-01"],
+    "lecturer_schedule_dates": ["l", "schedule", "Иванов И И", "-d", "2025-09-01,2025-09-02"],
+    "auditoriums_search": ["a", "search", "31"],
+    "auditorium_schedule": ["a", "schedule", "310ГЛ", "-d", "2025-09-02"],
+    "auditorium_schedule_dates": ["a", "schedule", "310ГЛ", "-d", "2025-09-01,2025-09-02"],
+}
+# Диапазоны дат и -F были только в oops/main.py
+OOPS_CASES = {
+    "student_range": GROUP + ["-d", "2025-09-01..2025-09-08"],
+    "student_with_finals_range": GROUP + ["-F", "-d", "2025-09-01..2025-12-31"],
+}
+# main/npi-api.py принимал -m после подкоманды, oops/main.py — перед ней
+WIDTH_CASES = {
+    "main": GROUP + ["-d", "2025-09-02", "-m", "12"],
+    "oops": ["-m", "12"] + GROUP + ["-d", "2025-09-02"],
+}
+
+
+def run(layout_name: str, argv: list[str]) -> None:
+    Main(LAYOUTS[layout_name]).start(["--no-cache", *argv])
+
+
+# Потоковый разбор ответа (--stream) должен давать тот же вывод
+@pytest.mark.parametrize("options", [[], ["--stream"]], ids=["buffered", "stream"])
+@pytest.mark.parametrize("layout_name", LAYOUTS)
+@pytest.mark.parametrize("case", [*CASES, "student_width"])
+def test_output_matches_old_cli(layout_name, case, options, capsys):
+    argv = WIDTH_CASES[layout_name] if case == "student_width" else CASES[case]
+    expected = (FIXTURES / "expected" / layout_name / (case + ".txt")).read_text(encoding="utf-8")
+
+    run(layout_name, options + argv)
+
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize("options", [[], ["--stream"]], ids=["buffered", "stream"])
+@pytest.mark.parametrize("case", OOPS_CASES)
+def test_output_matches_old_oops_cli(case, options, capsys):
+    expected = (FIXTURES / "expected" / "oops" / (case + ".txt")).read_text(encoding="utf-8")
+
+    run("oops", options + OOPS_CASES[case])
+
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize(
+    "date, message",
+    [
+        ("2025-09-01..bad", "некорректная дата «bad»"),
+        ("2025-09-01,2025-02-30", "некорректная дата «2025-02-30»"),
+        ("2025-09-08..2025-09-01", "начало диапазона 2025-09-08 позже конца 2025-09-01"),
+    ],
+)
+def test_bad_date_is_argparse_error(date, message, capsys):
+    with pytest.raises(SystemExit) as error:
+        run("oops", GROUP + ["-d", date])
+
+    assert error.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("finals_flag, shards", [([], "days"), (["-0"], "finals")])
+def test_export_matches_old_cli(finals_flag, shards, tmp_path):
+    expected_dir = FIXTURES / "expected" / "main" / "export" / shards
+
+    run("main", GROUP + ["-e", str(tmp_path), *finals_flag])
+
+    exported = sorted(path.name for path in (tmp_path / shards).iterdir())
+    assert exported == sorted(path.name for path in expected_dir.iterdir())
+    for name in exported:
+        assert (tmp_path / shards / name).read_bytes() == (expected_dir / name).read_bytes(), name
+
+
+def test_export_keeps_unchanged_shards(tmp_path):
+    run("main", GROUP + ["-e", str(tmp_path)])
+    shards = list((tmp_path / "days").iterdir())
+    for path in shards:
+        os.utime(path, ns=(0, 0))
+
+    run("main", GROUP + ["-e", str(tmp_path)])
+
+    assert all(path.stat().st_mtime_ns == 0 for path in shards)
+
+
+def test_metrics_file(tmp_path):
+    metrics_file = tmp_path / "npi_schedule.prom"
+
+    run("main", ["--metrics-file", str(metrics_file)] + CASES["student_dates"])
+
+    text = metrics_file.read_text(encoding="utf-8")
+    assert "npi_schedule_requests_total 1\n" in text
+    assert 'npi_schedule_lessons{query="date"} 4\n' in text
+
+
+def test_global_pandas_options_are_untouched(capsys):
+    # npi_schedule импортируют и как библиотеку — настройки pandas остаются значениями по умолчанию
+    run("oops", ["-m", "12"] + CASES["student"])
+    run("main", CASES["student"])
+
+    assert pandas.get_option("display.max_colwidth") == 50
+    assert pandas.get_option("display.expand_frame_repr") is True
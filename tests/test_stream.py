@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from conftest import RESPONSES, FakeResponse
+from npi_schedule import Client
+from npi_schedule.models import json_on_dates
+from npi_schedule.stream import load_filtered
+
+DATA = {
+    "group": 'И"С{П[а',
+    "count": 12345,
+    "classes": [
+        {
+            "dates": ["2025-09-%02d" % (index % 9 + 1)],
+            "class": index,
+            "discipline": 'x\\"]},' * (index % 3) + "ё😀",
+        }
+        for index in range(40)
+    ],
+    "tail": [1, 2.5e3, None, True],
+}
+KEEP = json_on_dates("2025-09-03,2025-09-05")
+
+
+def chunked(raw: bytes, size: int) -> list[bytes]:
+    return [raw[start:start + size] for start in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13, 64, 4096])
+def test_matches_json_loads_for_any_chunking(size):
+    raw = json.dumps(DATA, ensure_ascii=False, indent=1).encode()
+    expected = {**DATA, "classes": [info for info in DATA["classes"] if KEEP(info)]}
+
+    assert load_filtered(chunked(raw, size), KEEP) == expected
+    assert load_filtered(chunked(json.dumps(DATA["classes"]).encode(), size), KEEP) == expected["classes"]
+
+
+@pytest.mark.parametrize("raw", [b"", b'{"classes": [1, 2', b'{"a": 1} x', b'{"a" 1}', b"[1 2]"])
+def test_invalid_json(raw):
+    with pytest.raises(json.JSONDecodeError):
+        load_filtered(chunked(raw, 3), lambda info: True)
+
+
+def test_client_stream_skips_full_decoding(monkeypatch):
+    def fail(self):
+        raise AssertionError("ответ не должен декодироваться целиком")
+
+    dates = "2025-09-01..2025-09-02"
+    buffered = Client(use_cache=False).student_schedule("ИСПа", "F", 3, dates=dates)
+
+    monkeypatch.setattr(FakeResponse, "json", fail)
+    client = Client(use_cache=False, stream=True)
+    streamed = client.student_schedule("ИСПа", "F", 3, dates=dates)
+    finals = client.student_finals("ИСПа", "F", 3, dates="2025-12-25")
+
+    assert streamed == buffered
+    assert [lesson.dates for lesson in finals] == [("2025-12-25",), ("2025-12-25",)]
+    assert client.metrics.bytes == sum(
+        len(json.dumps(RESPONSES["v2/faculties/F/years/3/groups/ИСПа/" + path], ensure_ascii=False).encode())
+        for path in ("schedule", "finals-schedule")
+    )